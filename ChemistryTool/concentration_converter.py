@@ -8,8 +8,199 @@ validation for all conversions.
 """
 
 import math
-from typing import Dict, List, Tuple, Optional
-from utils import format_concentration, safe_float_conversion
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Optional
+
+
+# Fused multiply-add (x * y + z with a single rounding) where the interpreter
+# provides it (Python 3.13+), otherwise the plain expression.
+if hasattr(math, 'fma'):
+    _fma = math.fma
+else:
+    def _fma(x: float, y: float, z: float) -> float:
+        return x * y + z
+
+
+# Conversion kernels: pure arithmetic on already-validated inputs, kept at
+# module level so the class methods only carry argument validation.
+
+def _molarity_to_molality_kernel(molarity: float, solute_mw: float,
+                                 solvent_density: float) -> float:
+    """Return molality (mol/kg), or NaN if the solution density is too low."""
+    denominator = _fma(-molarity, solute_mw * 1e-3, solvent_density * 1000)
+    if denominator <= 0:
+        return math.nan
+    return molarity / denominator
+
+
+def _molality_to_molarity_kernel(molality: float, solute_mw: float,
+                                 solvent_density: float) -> float:
+    """Return molarity (mol/L) for a non-negative molality."""
+    return (molality * solvent_density * 1000) / _fma(molality, solute_mw * 1e-3, 1.0)
+
+
+def _molarity_to_normality_kernel(molarity: float, valence_factor: int) -> float:
+    """Return normality (eq/L)."""
+    return molarity * valence_factor
+
+
+def _normality_to_molarity_kernel(normality: float, valence_factor: int) -> float:
+    """Return molarity (mol/L)."""
+    return normality / valence_factor
+
+
+def _mass_percent_kernel(molarity: float, solute_mw: float,
+                         solvent_density: float) -> float:
+    """Return mass percent (%)."""
+    # M * MW * 100 / (density * 1000), with the constants folded together
+    return molarity * solute_mw * 0.1 / solvent_density
+
+
+def _molarity_from_mass_percent_kernel(mass_percent: float, solute_mw: float,
+                                       solvent_density: float) -> float:
+    """Return molarity (mol/L)."""
+    return (mass_percent * solvent_density * 10) / solute_mw
+
+
+def _parts_per_million_kernel(molarity: float, solute_mw: float,
+                              solvent_density: float) -> float:
+    """Return parts per million (ppm)."""
+    # M * MW * 1000000 / (density * 1000), with the constants folded together
+    return molarity * solute_mw * 1000 / solvent_density
+
+
+# Standard density of water at 25C (g/mL)
+_WATER_DENSITY: Final[float] = 0.997
+
+# Common solvent densities (g/mL) at 25C, keyed by lowercase name. Read-only
+# so the table can be shared by every converter without defensive copies.
+_SOLVENT_DENSITIES = MappingProxyType({
+    'water': 0.997,
+    'ethanol': 0.789,
+    'methanol': 0.791,
+    'acetone': 0.784,
+    'toluene': 0.867,
+    'hexane': 0.659,
+    'dichloromethane': 1.33,
+    'chloroform': 1.49
+})
+
+
+def _validate_solution(value: float, name: str, solute_mw: float,
+                       solvent_density: Optional[float]) -> float:
+    """
+    Validate the parameters shared by the density-based conversions.
+    
+    Args:
+        value (float): Concentration value being converted
+        name (str): Name of the concentration, used in error messages
+        solute_mw (float): Molecular weight of solute in g/mol
+        solvent_density (Optional[float]): Density of solvent in g/mL, or None for water
+    
+    Returns:
+        float: The solvent density to use, in g/mL
+    
+    Raises:
+        ValueError: If invalid parameters provided
+    """
+    if value < 0:
+        raise ValueError(f"{name} cannot be negative")
+    
+    if solute_mw <= 0:
+        raise ValueError("Molecular weight must be positive")
+    
+    if solvent_density is None:
+        solvent_density = _WATER_DENSITY
+    
+    if solvent_density <= 0:
+        raise ValueError("Solvent density must be positive")
+    
+    return solvent_density
+
+
+# Supported conversions keyed by canonical (from_unit, to_unit). Each entry
+# names the converter method, which extra parameter it takes, and the
+# templates for the step-by-step explanation.
+_CONVERSIONS = {
+    ('M', 'm'): ('molarity_to_molality', 'solvent_density', (
+        "1. Original molarity: {value} mol/L",
+        "2. Solute molecular weight: {solute_mw} g/mol",
+        "3. Solvent density: {solvent_density} g/mL",
+        "4. Converted molality: {converted_value} mol/kg",
+    )),
+    ('m', 'M'): ('molality_to_molarity', 'solvent_density', (
+        "1. Original molality: {value} mol/kg",
+        "2. Solute molecular weight: {solute_mw} g/mol",
+        "3. Solvent density: {solvent_density} g/mL",
+        "4. Converted molarity: {converted_value} mol/L",
+    )),
+    ('M', 'N'): ('molarity_to_normality', 'valence_factor', (
+        "1. Original molarity: {value} mol/L",
+        "2. Valence factor: {valence_factor}",
+        "3. Converted normality: {converted_value} N",
+    )),
+    ('N', 'M'): ('normality_to_molarity', 'valence_factor', (
+        "1. Original normality: {value} N",
+        "2. Valence factor: {valence_factor}",
+        "3. Converted molarity: {converted_value} mol/L",
+    )),
+    ('M', '%'): ('calculate_mass_percent', 'solvent_density', (
+        "1. Original molarity: {value} mol/L",
+        "2. Solute molecular weight: {solute_mw} g/mol",
+        "3. Solvent density: {solvent_density} g/mL",
+        "4. Converted mass percent: {converted_value}%",
+    )),
+    ('%', 'M'): ('calculate_molarity_from_mass_percent', 'solvent_density', (
+        "1. Original mass percent: {value}%",
+        "2. Solute molecular weight: {solute_mw} g/mol",
+        "3. Solvent density: {solvent_density} g/mL",
+        "4. Converted molarity: {converted_value} mol/L",
+    )),
+    ('M', 'ppm'): ('calculate_parts_per_million', 'solvent_density', (
+        "1. Original molarity: {value} mol/L",
+        "2. Solute molecular weight: {solute_mw} g/mol",
+        "3. Solvent density: {solvent_density} g/mL",
+        "4. Converted ppm: {converted_value} ppm",
+    )),
+}
+
+
+# Step template for converting a unit to itself
+_IDENTITY_STEPS = ("1. No conversion needed: {value} is unchanged",)
+
+
+def _identity_conversion(value: float, solute_mw: float, extra: float) -> float:
+    """Return value unchanged; used when both units are the same."""
+    if value < 0:
+        raise ValueError("Concentration value cannot be negative")
+    return value
+
+
+# Accepted spellings of each concentration unit. 'M' (molarity) and 'm'
+# (molality) are case-sensitive; 'N' and 'ppm' are not.
+_CANONICAL_UNITS = {
+    'M': 'M',
+    'm': 'm',
+    'N': 'N',
+    'n': 'N',
+    '%': '%',
+    'ppm': 'ppm',
+    'PPM': 'ppm',
+    'Ppm': 'ppm',
+}
+
+
+def _canonical_unit(unit: str) -> Optional[str]:
+    """
+    Normalize a unit spelling, or return None if the unit is not supported.
+    
+    Common spellings hit the table directly; any other casing of 'ppm' is
+    found by the lowercase fallback.
+    """
+    canonical = _CANONICAL_UNITS.get(unit)
+    if canonical is None and isinstance(unit, str):
+        canonical = _CANONICAL_UNITS.get(unit.lower())
+    return canonical
 
 
 class ConcentrationConverter:
@@ -21,25 +212,18 @@ class ConcentrationConverter:
     include step-by-step dimensional analysis for educational purposes.
     """
     
-    def __init__(self):
-        """Initialize the concentration converter."""
-        # Standard density of water at 25C (g/mL)
-        self.water_density = 0.997
-        
-        # Common solvent densities (g/mL) at 25C
-        self.solvent_densities = {
-            'water': 0.997,
-            'ethanol': 0.789,
-            'methanol': 0.791,
-            'acetone': 0.784,
-            'toluene': 0.867,
-            'hexane': 0.659,
-            'dichloromethane': 1.33,
-            'chloroform': 1.49
-        }
+    # The converter holds no per-instance state; its constants live on the class
+    __slots__ = ()
     
-    def molarity_to_molality(self, molarity: float, solute_mw: float, 
-                           solvent_density: float = None) -> float:
+    # Standard density of water at 25C (g/mL)
+    water_density: Final[float] = _WATER_DENSITY
+    
+    # Common solvent densities (g/mL) at 25C
+    solvent_densities = _SOLVENT_DENSITIES
+    
+    @staticmethod
+    def molarity_to_molality(molarity: float, solute_mw: float, 
+                             solvent_density: float = None) -> float:
         """
         Convert molarity (M) to molality (m).
         
@@ -56,34 +240,19 @@ class ConcentrationConverter:
         Raises:
             ValueError: If invalid parameters provided
         """
-        if molarity < 0:
-            raise ValueError("Molarity cannot be negative")
+        solvent_density = _validate_solution(molarity, "Molarity", solute_mw,
+                                             solvent_density)
         
-        if solute_mw <= 0:
-            raise ValueError("Molecular weight must be positive")
-        
-        if solvent_density is None:
-            solvent_density = self.water_density
-        
-        if solvent_density <= 0:
-            raise ValueError("Solvent density must be positive")
-        
-        # Convert density from g/mL to g/L
-        density_g_l = solvent_density * 1000
-        
-        # Calculate molality using the formula
-        # m = M / (density - M * MW_solute / 1000)
-        denominator = density_g_l - (molarity * solute_mw / 1000)
+        molality = _molarity_to_molality_kernel(molarity, solute_mw, solvent_density)
         
-        if denominator <= 0:
+        if math.isnan(molality):
             raise ValueError("Invalid concentration: solution density too low")
         
-        molality = molarity / denominator
-        
         return molality
     
-    def molality_to_molarity(self, molality: float, solute_mw: float, 
-                           solvent_density: float = None) -> float:
+    @staticmethod
+    def molality_to_molarity(molality: float, solute_mw: float, 
+                             solvent_density: float = None) -> float:
         """
         Convert molality (m) to molarity (M).
         
@@ -100,34 +269,14 @@ class ConcentrationConverter:
         Raises:
             ValueError: If invalid parameters provided
         """
-        if molality < 0:
-            raise ValueError("Molality cannot be negative")
-        
-        if solute_mw <= 0:
-            raise ValueError("Molecular weight must be positive")
+        solvent_density = _validate_solution(molality, "Molality", solute_mw,
+                                             solvent_density)
         
-        if solvent_density is None:
-            solvent_density = self.water_density
-        
-        if solvent_density <= 0:
-            raise ValueError("Solvent density must be positive")
-        
-        # Convert density from g/mL to g/L
-        density_g_l = solvent_density * 1000
-        
-        # Calculate molarity using the formula
-        # M = m * density / (1 + m * MW_solute / 1000)
-        denominator = 1 + (molality * solute_mw / 1000)
-        
-        if denominator <= 0:
-            raise ValueError("Invalid concentration")
-        
-        molarity = (molality * density_g_l) / denominator
-        
-        return molarity
+        return _molality_to_molarity_kernel(molality, solute_mw, solvent_density)
     
-    def molarity_to_normality(self, molarity: float, solute_mw: float, 
-                            valence_factor: int = 1) -> float:
+    @staticmethod
+    def molarity_to_normality(molarity: float, solute_mw: float, 
+                              valence_factor: int = 1) -> float:
         """
         Convert molarity (M) to normality (N).
         
@@ -153,12 +302,11 @@ class ConcentrationConverter:
         if valence_factor <= 0:
             raise ValueError("Valence factor must be positive")
         
-        normality = molarity * valence_factor
-        
-        return normality
+        return _molarity_to_normality_kernel(molarity, valence_factor)
     
-    def normality_to_molarity(self, normality: float, solute_mw: float, 
-                            valence_factor: int = 1) -> float:
+    @staticmethod
+    def normality_to_molarity(normality: float, solute_mw: float, 
+                              valence_factor: int = 1) -> float:
         """
         Convert normality (N) to molarity (M).
         
@@ -184,12 +332,11 @@ class ConcentrationConverter:
         if valence_factor <= 0:
             raise ValueError("Valence factor must be positive")
         
-        molarity = normality / valence_factor
-        
-        return molarity
+        return _normality_to_molarity_kernel(normality, valence_factor)
     
-    def calculate_mass_percent(self, molarity: float, solute_mw: float, 
-                             solvent_density: float = None) -> float:
+    @staticmethod
+    def calculate_mass_percent(molarity: float, solute_mw: float, 
+                               solvent_density: float = None) -> float:
         """
         Calculate mass percent from molarity.
         
@@ -206,27 +353,14 @@ class ConcentrationConverter:
         Raises:
             ValueError: If invalid parameters provided
         """
-        if molarity < 0:
-            raise ValueError("Molarity cannot be negative")
+        solvent_density = _validate_solution(molarity, "Molarity", solute_mw,
+                                             solvent_density)
         
-        if solute_mw <= 0:
-            raise ValueError("Molecular weight must be positive")
-        
-        if solvent_density is None:
-            solvent_density = self.water_density
-        
-        if solvent_density <= 0:
-            raise ValueError("Solvent density must be positive")
-        
-        # Convert density from g/mL to g/L
-        density_g_l = solvent_density * 1000
-        
-        mass_percent = (molarity * solute_mw * 100) / density_g_l
-        
-        return mass_percent
+        return _mass_percent_kernel(molarity, solute_mw, solvent_density)
     
-    def calculate_molarity_from_mass_percent(self, mass_percent: float, solute_mw: float,
-                                           solvent_density: float = None) -> float:
+    @staticmethod
+    def calculate_molarity_from_mass_percent(mass_percent: float, solute_mw: float,
+                                             solvent_density: float = None) -> float:
         """
         Calculate molarity from mass percent.
         
@@ -246,21 +380,14 @@ class ConcentrationConverter:
         if mass_percent < 0 or mass_percent > 100:
             raise ValueError("Mass percent must be between 0 and 100")
         
-        if solute_mw <= 0:
-            raise ValueError("Molecular weight must be positive")
+        solvent_density = _validate_solution(mass_percent, "Mass percent", solute_mw,
+                                             solvent_density)
         
-        if solvent_density is None:
-            solvent_density = self.water_density
-        
-        if solvent_density <= 0:
-            raise ValueError("Solvent density must be positive")
-        
-        molarity = (mass_percent * solvent_density * 10) / solute_mw
-        
-        return molarity
+        return _molarity_from_mass_percent_kernel(mass_percent, solute_mw, solvent_density)
     
-    def calculate_parts_per_million(self, molarity: float, solute_mw: float,
-                                  solvent_density: float = None) -> float:
+    @staticmethod
+    def calculate_parts_per_million(molarity: float, solute_mw: float,
+                                    solvent_density: float = None) -> float:
         """
         Calculate parts per million (ppm) from molarity.
         
@@ -277,27 +404,113 @@ class ConcentrationConverter:
         Raises:
             ValueError: If invalid parameters provided
         """
-        if molarity < 0:
-            raise ValueError("Molarity cannot be negative")
+        solvent_density = _validate_solution(molarity, "Molarity", solute_mw,
+                                             solvent_density)
         
-        if solute_mw <= 0:
-            raise ValueError("Molecular weight must be positive")
+        return _parts_per_million_kernel(molarity, solute_mw, solvent_density)
+    
+    @staticmethod
+    def molarity_to_molality_batch(molarities: List[float], solute_mw: float,
+                                   solvent_density: float = None) -> List[float]:
+        """
+        Convert a sequence of molarities (M) to molalities (m).
         
-        if solvent_density is None:
-            solvent_density = self.water_density
+        Applies the same formula as molarity_to_molality, with the validation
+        and shared factors computed once for the whole batch instead of per value.
         
-        if solvent_density <= 0:
-            raise ValueError("Solvent density must be positive")
+        Args:
+            molarities (List[float]): Concentrations in mol/L
+            solute_mw (float): Molecular weight of solute in g/mol
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            
+        Returns:
+            List[float]: Concentrations in mol/kg (NaN where the solution
+                         density is too low for the given molarity)
+            
+        Raises:
+            ValueError: If invalid parameters provided
+        """
+        solvent_density = _validate_solution(min(molarities, default=0.0), "Molarity",
+                                             solute_mw, solvent_density)
+        
+        return [_molarity_to_molality_kernel(molarity, solute_mw, solvent_density)
+                for molarity in molarities]
+    
+    @staticmethod
+    def molality_to_molarity_batch(molalities: List[float], solute_mw: float,
+                                   solvent_density: float = None) -> List[float]:
+        """
+        Convert a sequence of molalities (m) to molarities (M).
+        
+        Args:
+            molalities (List[float]): Concentrations in mol/kg
+            solute_mw (float): Molecular weight of solute in g/mol
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            
+        Returns:
+            List[float]: Concentrations in mol/L
+            
+        Raises:
+            ValueError: If invalid parameters provided
+        """
+        solvent_density = _validate_solution(min(molalities, default=0.0), "Molality",
+                                             solute_mw, solvent_density)
+        
+        return [_molality_to_molarity_kernel(molality, solute_mw, solvent_density)
+                for molality in molalities]
+    
+    @staticmethod
+    def calculate_mass_percent_batch(molarities: List[float], solute_mw: float,
+                                     solvent_density: float = None) -> List[float]:
+        """
+        Calculate mass percents for a sequence of molarities.
+        
+        Args:
+            molarities (List[float]): Concentrations in mol/L
+            solute_mw (float): Molecular weight of solute in g/mol
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            
+        Returns:
+            List[float]: Mass percents (%)
+            
+        Raises:
+            ValueError: If invalid parameters provided
+        """
+        solvent_density = _validate_solution(min(molarities, default=0.0), "Molarity",
+                                             solute_mw, solvent_density)
         
-        # Convert density from g/mL to g/L
-        density_g_l = solvent_density * 1000
+        factor = solute_mw * 0.1 / solvent_density
         
-        ppm = (molarity * solute_mw * 1000000) / density_g_l
+        return [molarity * factor for molarity in molarities]
+    
+    @staticmethod
+    def calculate_parts_per_million_batch(molarities: List[float], solute_mw: float,
+                                          solvent_density: float = None) -> List[float]:
+        """
+        Calculate parts per million (ppm) for a sequence of molarities.
         
-        return ppm
+        Args:
+            molarities (List[float]): Concentrations in mol/L
+            solute_mw (float): Molecular weight of solute in g/mol
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            
+        Returns:
+            List[float]: Concentrations in ppm
+            
+        Raises:
+            ValueError: If invalid parameters provided
+        """
+        solvent_density = _validate_solution(min(molarities, default=0.0), "Molarity",
+                                             solute_mw, solvent_density)
+        
+        factor = solute_mw * 1000 / solvent_density
+        
+        return [molarity * factor for molarity in molarities]
     
     def get_conversion_analysis(self, from_unit: str, to_unit: str, value: float,
-                              solute_mw: float, **kwargs) -> Dict[str, any]:
+                                solute_mw: float, *, solvent_density: float = None,
+                                valence_factor: int = 1,
+                                include_steps: bool = False) -> Dict[str, Any]:
         """
         Get a comprehensive analysis of a concentration conversion.
         
@@ -306,11 +519,17 @@ class ConcentrationConverter:
             to_unit (str): Target unit (M, m, N, %, ppm)
             value (float): Original concentration value
             solute_mw (float): Molecular weight of solute in g/mol
-            **kwargs: Additional parameters (solvent_density, valence_factor, etc.)
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            valence_factor (int): Number of equivalents per mole (default: 1)
+            include_steps (bool): Whether to build the step-by-step explanation
+                                  in 'conversion_steps' (default: False)
             
         Returns:
-            Dict[str, any]: Comprehensive conversion analysis
+            Dict[str, Any]: Comprehensive conversion analysis
         """
+        if solvent_density is None:
+            solvent_density = self.water_density
+        
         try:
             # Validate input parameters
             if value < 0:
@@ -319,78 +538,29 @@ class ConcentrationConverter:
             if solute_mw <= 0:
                 raise ValueError("Molecular weight must be positive")
             
-            # Get solvent density
-            solvent_density = kwargs.get('solvent_density', self.water_density)
-            valence_factor = kwargs.get('valence_factor', 1)
+            # Look up the conversion for the normalized unit pair
+            key = (_canonical_unit(from_unit), _canonical_unit(to_unit))
+            if key[0] is not None and key[0] == key[1]:
+                converted_value = value
+                step_templates = _IDENTITY_STEPS
+            elif key in _CONVERSIONS:
+                method_name, param, step_templates = _CONVERSIONS[key]
+                extra = valence_factor if param == 'valence_factor' else solvent_density
+                converted_value = getattr(self, method_name)(value, solute_mw, extra)
+            else:
+                raise ValueError(f"Unsupported conversion: {from_unit} to {to_unit}")
             
-            # Perform conversion based on unit types
-            converted_value = None
+            # Formatting the explanation is only worth it when it will be shown
             conversion_steps = []
-            
-            if from_unit.upper() == 'M' and to_unit.lower() == 'm':
-                converted_value = self.molarity_to_molality(value, solute_mw, solvent_density)
+            if include_steps:
                 conversion_steps = [
-                    f"1. Original molarity: {value} mol/L",
-                    f"2. Solute molecular weight: {solute_mw} g/mol",
-                    f"3. Solvent density: {solvent_density} g/mL",
-                    f"4. Converted molality: {converted_value} mol/kg"
+                    step.format(value=value, solute_mw=solute_mw,
+                                solvent_density=solvent_density,
+                                valence_factor=valence_factor,
+                                converted_value=converted_value)
+                    for step in step_templates
                 ]
             
-            elif from_unit.lower() == 'm' and to_unit.upper() == 'M':
-                converted_value = self.molality_to_molarity(value, solute_mw, solvent_density)
-                conversion_steps = [
-                    f"1. Original molality: {value} mol/kg",
-                    f"2. Solute molecular weight: {solute_mw} g/mol",
-                    f"3. Solvent density: {solvent_density} g/mL",
-                    f"4. Converted molarity: {converted_value} mol/L"
-                ]
-            
-            elif from_unit.upper() == 'M' and to_unit.upper() == 'N':
-                converted_value = self.molarity_to_normality(value, solute_mw, valence_factor)
-                conversion_steps = [
-                    f"1. Original molarity: {value} mol/L",
-                    f"2. Valence factor: {valence_factor}",
-                    f"3. Converted normality: {converted_value} N"
-                ]
-            
-            elif from_unit.upper() == 'N' and to_unit.upper() == 'M':
-                converted_value = self.normality_to_molarity(value, solute_mw, valence_factor)
-                conversion_steps = [
-                    f"1. Original normality: {value} N",
-                    f"2. Valence factor: {valence_factor}",
-                    f"3. Converted molarity: {converted_value} mol/L"
-                ]
-            
-            elif from_unit.upper() == 'M' and to_unit == '%':
-                converted_value = self.calculate_mass_percent(value, solute_mw, solvent_density)
-                conversion_steps = [
-                    f"1. Original molarity: {value} mol/L",
-                    f"2. Solute molecular weight: {solute_mw} g/mol",
-                    f"3. Solvent density: {solvent_density} g/mL",
-                    f"4. Converted mass percent: {converted_value}%"
-                ]
-            
-            elif from_unit == '%' and to_unit.upper() == 'M':
-                converted_value = self.calculate_molarity_from_mass_percent(value, solute_mw, solvent_density)
-                conversion_steps = [
-                    f"1. Original mass percent: {value}%",
-                    f"2. Solute molecular weight: {solute_mw} g/mol",
-                    f"3. Solvent density: {solvent_density} g/mL",
-                    f"4. Converted molarity: {converted_value} mol/L"
-                ]
-            
-            elif from_unit.upper() == 'M' and to_unit.lower() == 'ppm':
-                converted_value = self.calculate_parts_per_million(value, solute_mw, solvent_density)
-                conversion_steps = [
-                    f"1. Original molarity: {value} mol/L",
-                    f"2. Solute molecular weight: {solute_mw} g/mol",
-                    f"3. Solvent density: {solvent_density} g/mL",
-                    f"4. Converted ppm: {converted_value} ppm"
-                ]
-            
-            else:
-                raise ValueError(f"Unsupported conversion: {from_unit} to {to_unit}")
-            
             analysis = {
                 'from_unit': from_unit,
                 'to_unit': to_unit,
@@ -412,12 +582,80 @@ class ConcentrationConverter:
                 'original_value': value,
                 'converted_value': None,
                 'solute_mw': solute_mw,
-                'solvent_density': kwargs.get('solvent_density', self.water_density),
+                'solvent_density': solvent_density,
                 'conversion_steps': [],
                 'is_valid': False,
                 'error': str(e)
             }
     
+    def get_conversion_analysis_batch(self, from_unit: str, to_unit: str,
+                                      values: List[float], solute_mw: float, *,
+                                      solvent_density: float = None,
+                                      valence_factor: int = 1) -> Dict[str, Any]:
+        """
+        Convert a sequence of concentration values between two units.
+        
+        The unit pair is resolved once for the whole batch. A value that cannot
+        be converted does not abort the batch; its result is None and its entry
+        in 'valid_mask' is False.
+        
+        Args:
+            from_unit (str): Original unit (M, m, N, %, ppm)
+            to_unit (str): Target unit (M, m, N, %, ppm)
+            values (List[float]): Original concentration values
+            solute_mw (float): Molecular weight of solute in g/mol
+            solvent_density (float): Density of solvent in g/mL (default: water)
+            valence_factor (int): Number of equivalents per mole (default: 1)
+            
+        Returns:
+            Dict[str, Any]: Batch conversion analysis
+        """
+        if solvent_density is None:
+            solvent_density = self.water_density
+        
+        analysis = {
+            'from_unit': from_unit,
+            'to_unit': to_unit,
+            'original_values': values,
+            'converted_values': [],
+            'valid_mask': [],
+            'solute_mw': solute_mw,
+            'solvent_density': solvent_density,
+            'is_valid': True,
+            'error': None
+        }
+        
+        key = (_canonical_unit(from_unit), _canonical_unit(to_unit))
+        if key[0] is None or (key[0] != key[1] and key not in _CONVERSIONS):
+            analysis['is_valid'] = False
+            analysis['error'] = f"Unsupported conversion: {from_unit} to {to_unit}"
+            return analysis
+        
+        if solute_mw <= 0:
+            analysis['is_valid'] = False
+            analysis['error'] = "Molecular weight must be positive"
+            return analysis
+        
+        if key[0] == key[1]:
+            converter = _identity_conversion
+            extra = None
+        else:
+            method_name, param, _ = _CONVERSIONS[key]
+            converter = getattr(self, method_name)
+            extra = valence_factor if param == 'valence_factor' else solvent_density
+        
+        converted_values = analysis['converted_values']
+        valid_mask = analysis['valid_mask']
+        for value in values:
+            try:
+                converted_values.append(converter(value, solute_mw, extra))
+                valid_mask.append(True)
+            except ValueError:
+                converted_values.append(None)
+                valid_mask.append(False)
+        
+        return analysis
+    
     def get_solvent_density(self, solvent_name: str) -> float:
         """
         Get the density of a common solvent.
@@ -431,12 +669,12 @@ class ConcentrationConverter:
         Raises:
             ValueError: If solvent not found
         """
-        solvent_name_lower = solvent_name.lower()
+        density = self.solvent_densities.get(solvent_name.lower())
         
-        if solvent_name_lower not in self.solvent_densities:
+        if density is None:
             raise ValueError(f"Unknown solvent: {solvent_name}")
         
-        return self.solvent_densities[solvent_name_lower]
+        return density
     
     def list_available_solvents(self) -> List[str]:
         """
@@ -445,4 +683,4 @@ class ConcentrationConverter:
         Returns:
             List[str]: List of solvent names
         """
-        return list(self.solvent_densities.keys()) 
\ No newline at end of file
+        return list(self.solvent_densities) 
\ No newline at end of file
@@ -7,11 +7,154 @@ the relationships between different units and validates calculations.
 
 """
 
-import re
-from typing import Dict, List, Tuple, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, NamedTuple, Sequence, Tuple, Optional
 from utils import format_concentration, safe_float_conversion
 
 
+# Simplified atomic weights (g/mol) used for the molecular weight walkthrough
+_ATOMIC_WEIGHTS: Final[Mapping[str, float]] = MappingProxyType({
+    'H': 1.008, 'C': 12.011, 'N': 14.007, 'O': 15.999,
+    'F': 18.998, 'Na': 22.990, 'Mg': 24.305, 'Al': 26.982,
+    'Si': 28.086, 'P': 30.974, 'S': 32.065, 'Cl': 35.453,
+    'K': 39.098, 'Ca': 40.078, 'Fe': 55.845, 'Cu': 63.546,
+    'Zn': 65.38, 'Br': 79.904, 'Ag': 107.868, 'I': 126.904
+})
+
+
+def _make_converter(from_factor: float, from_offset: float, to_offset: float,
+                    to_factor: float) -> Callable[[float], float]:
+    """
+    Build a single-value converter specialized for one pair of unit definitions.
+    
+    Every converter evaluates the same operations, in the same order, as the
+    step-by-step walkthrough, so results match the steps exactly. Aliases of a
+    unit with factor 1.0 get a plain float conversion, equal to value * 1.0 / 1.0.
+    """
+    if from_offset or to_offset:
+        return partial(_offset_convert, from_factor, from_offset, to_offset, to_factor)
+    if from_factor == 1.0 and to_factor == 1.0:
+        return float
+    return partial(_scale_convert, from_factor, to_factor)
+
+
+def _scale_convert(from_factor: float, to_factor: float, value: float) -> float:
+    """
+    Convert between offset-free units through the base unit.
+    
+    Folding the factors into one multiplier changes results, e.g. 0.1 Pa -> bar.
+    """
+    return value * from_factor / to_factor
+
+
+def _offset_convert(from_factor: float, from_offset: float, to_offset: float,
+                    to_factor: float, value: float) -> float:
+    """
+    Convert between units with an offset (temperatures) through the base unit.
+    
+    Evaluated in the same order as the step-by-step walkthrough; folding the
+    offsets into one multiply-add loses exactness, e.g. 32 F -> C.
+    """
+    return (value * from_factor + from_offset - to_offset) / to_factor
+
+
+# Elements that do not trigger an "unusual element" warning
+_COMMON_ELEMENTS: Final = frozenset({'H', 'C', 'N', 'O', 'S', 'P', 'Cl', 'Na', 'K', 'Ca', 'Mg', 'Fe'})
+
+
+# Fixed headings shared by every step-by-step analysis
+_MW_HEADER: Final = "Molecular Weight Calculation Analysis:"
+_SEP40: Final = "=" * 40
+_SEP50: Final = "=" * 50
+_NORMALITY_HEADER: Final = "2. Normality calculation:"
+_MOLARITY_HEADER: Final = "2. Molarity calculation:"
+
+
+# Templates for the unit conversion walkthrough, indexed by Step.template
+_CONVERSION_STEP_TEMPLATES: Final[Tuple[str, ...]] = (
+    "1. Original value: {} {}",
+    "2. Base unit: {}",
+    "3. Convert to base unit: {} x {} = {}",
+    "4. Convert to target unit: {} / {} = {}",
+    "5. Final result: {} {}",
+    "1. No conversion needed: {} {}",
+)
+
+
+class UnitDef(NamedTuple):
+    """Definition of a unit relative to its base unit."""
+    factor: float
+    base: str
+    offset: float = 0.0
+
+
+class Step(NamedTuple):
+    """A conversion step kept as raw values until it is rendered."""
+    template: int
+    args: Tuple[Any, ...]
+
+
+def render_steps(steps: Sequence[Step]) -> List[str]:
+    """
+    Format deferred conversion steps into readable strings.
+    
+    Args:
+        steps (Sequence[Step]): Steps returned by convert_units(deferred=True)
+        
+    Returns:
+        List[str]: Step-by-step analysis
+    """
+    return [_CONVERSION_STEP_TEMPLATES[step.template].format(*step.args) for step in steps]
+
+
+# Common unit conversions by unit type, shown by get_unit_conversion_guide
+_UNIT_CONVERSION_GUIDE: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    'Length': (
+        '1 m = 100 cm = 1000 mm',
+        '1 km = 1000 m',
+        '1 in = 2.54 cm',
+        '1 ft = 30.48 cm',
+        '1 yd = 91.44 cm'
+    ),
+    'Volume': (
+        '1 L = 1000 mL',
+        '1 L = 1 dm',
+        '1 mL = 1 cm',
+        '1 gal = 3.785 L'
+    ),
+    'Mass': (
+        '1 kg = 1000 g',
+        '1 g = 1000 mg',
+        '1 lb = 453.592 g',
+        '1 oz = 28.3495 g'
+    ),
+    'Concentration': (
+        '1 M = 1 mol/L',
+        '1 molal = 1 mol/kg',
+        '1 N = 1 eq/L',
+        '1 ppm = 1 mg/L (for dilute aqueous solutions)',
+        '1% = 10 g/L (for dilute aqueous solutions)'
+    ),
+    'Temperature': (
+        'K = C + 273.15',
+        'C = (F - 32) x 5/9',
+        'F = C x 9/5 + 32'
+    )
+})
+
+
+# Step-by-step concentration analyses keyed by (from_unit, to_unit). 'M' is
+# molarity and 'm' is molality, so the keys are case-sensitive. Each entry
+# names the analyzer method and whether it takes the solute molecular weight.
+_CONCENTRATION_ANALYSES = {
+    ('M', 'm'): ('_analyze_molarity_to_molality', True),
+    ('m', 'M'): ('_analyze_molality_to_molarity', True),
+    ('M', 'N'): ('_analyze_molarity_to_normality', False),
+    ('N', 'M'): ('_analyze_normality_to_molarity', False),
+}
+
+
 class DimensionalAnalyzer:
     """
     Analyzer for dimensional analysis and unit conversions.
@@ -24,64 +167,65 @@ class DimensionalAnalyzer:
     def __init__(self):
         """Initialize the dimensional analyzer with unit definitions."""
         # Define common units and their relationships
-        self.units = {
+        self.units: Dict[str, UnitDef] = {
             # Length units
-            'm': {'base': 'm', 'factor': 1.0},
-            'cm': {'base': 'm', 'factor': 0.01},
-            'mm': {'base': 'm', 'factor': 0.001},
-            'km': {'base': 'm', 'factor': 1000.0},
-            'in': {'base': 'm', 'factor': 0.0254},
-            'ft': {'base': 'm', 'factor': 0.3048},
-            'yd': {'base': 'm', 'factor': 0.9144},
+            'm': UnitDef(1.0, 'm'),
+            'cm': UnitDef(0.01, 'm'),
+            'mm': UnitDef(0.001, 'm'),
+            'km': UnitDef(1000.0, 'm'),
+            'in': UnitDef(0.0254, 'm'),
+            'ft': UnitDef(0.3048, 'm'),
+            'yd': UnitDef(0.9144, 'm'),
             
             # Volume units
-            'L': {'base': 'L', 'factor': 1.0},
-            'mL': {'base': 'L', 'factor': 0.001},
-            'cm3': {'base': 'L', 'factor': 0.001},
-            'dm3': {'base': 'L', 'factor': 1.0},
-            'gal': {'base': 'L', 'factor': 3.78541},
+            'L': UnitDef(1.0, 'L'),
+            'mL': UnitDef(0.001, 'L'),
+            'cm3': UnitDef(0.001, 'L'),
+            'dm3': UnitDef(1.0, 'L'),
+            'gal': UnitDef(3.78541, 'L'),
             
             # Mass units
-            'g': {'base': 'g', 'factor': 1.0},
-            'kg': {'base': 'g', 'factor': 1000.0},
-            'mg': {'base': 'g', 'factor': 0.001},
-            'lb': {'base': 'g', 'factor': 453.592},
-            'oz': {'base': 'g', 'factor': 28.3495},
+            'g': UnitDef(1.0, 'g'),
+            'kg': UnitDef(1000.0, 'g'),
+            'mg': UnitDef(0.001, 'g'),
+            'lb': UnitDef(453.592, 'g'),
+            'oz': UnitDef(28.3495, 'g'),
             
             # Time units
-            's': {'base': 's', 'factor': 1.0},
-            'min': {'base': 's', 'factor': 60.0},
-            'h': {'base': 's', 'factor': 3600.0},
-            'day': {'base': 's', 'factor': 86400.0},
+            's': UnitDef(1.0, 's'),
+            'min': UnitDef(60.0, 's'),
+            'h': UnitDef(3600.0, 's'),
+            'day': UnitDef(86400.0, 's'),
             
             # Temperature units
-            'K': {'base': 'K', 'factor': 1.0},
-            'C': {'base': 'K', 'factor': 1.0, 'offset': 273.15},
-            'F': {'base': 'K', 'factor': 5/9, 'offset': 273.15 - 32*5/9},
+            'K': UnitDef(1.0, 'K'),
+            'C': UnitDef(1.0, 'K', 273.15),
+            'F': UnitDef(5/9, 'K', 273.15 - 32*5/9),
             
             # Concentration units
-            'mol/L': {'base': 'mol/L', 'factor': 1.0},
-            'M': {'base': 'mol/L', 'factor': 1.0},
-            'mol/kg': {'base': 'mol/kg', 'factor': 1.0},
-            'm': {'base': 'mol/kg', 'factor': 1.0},
-            'N': {'base': 'eq/L', 'factor': 1.0},
-            'eq/L': {'base': 'eq/L', 'factor': 1.0},
-            'ppm': {'base': 'ppm', 'factor': 1.0},
-            '%': {'base': '%', 'factor': 1.0},
+            'mol/L': UnitDef(1.0, 'mol/L'),
+            'M': UnitDef(1.0, 'mol/L'),
+            'mol/kg': UnitDef(1.0, 'mol/kg'),
+            # Molality is 'molal' here because 'm' is already the meter
+            'molal': UnitDef(1.0, 'mol/kg'),
+            'N': UnitDef(1.0, 'eq/L'),
+            'eq/L': UnitDef(1.0, 'eq/L'),
+            'ppm': UnitDef(1.0, 'ppm'),
+            '%': UnitDef(1.0, '%'),
             
             # Pressure units
-            'Pa': {'base': 'Pa', 'factor': 1.0},
-            'kPa': {'base': 'Pa', 'factor': 1000.0},
-            'atm': {'base': 'Pa', 'factor': 101325.0},
-            'bar': {'base': 'Pa', 'factor': 100000.0},
-            'torr': {'base': 'Pa', 'factor': 133.322},
-            'mmHg': {'base': 'Pa', 'factor': 133.322},
+            'Pa': UnitDef(1.0, 'Pa'),
+            'kPa': UnitDef(1000.0, 'Pa'),
+            'atm': UnitDef(101325.0, 'Pa'),
+            'bar': UnitDef(100000.0, 'Pa'),
+            'torr': UnitDef(133.322, 'Pa'),
+            'mmHg': UnitDef(133.322, 'Pa'),
             
             # Energy units
-            'J': {'base': 'J', 'factor': 1.0},
-            'kJ': {'base': 'J', 'factor': 1000.0},
-            'cal': {'base': 'J', 'factor': 4.184},
-            'kcal': {'base': 'J', 'factor': 4184.0},
+            'J': UnitDef(1.0, 'J'),
+            'kJ': UnitDef(1000.0, 'J'),
+            'cal': UnitDef(4.184, 'J'),
+            'kcal': UnitDef(4184.0, 'J'),
         }
         
         # Define derived units and their relationships
@@ -93,6 +237,18 @@ class DimensionalAnalyzer:
             'pressure': {'base_units': ['Pa'], 'formula': 'Pa'},
             'energy': {'base_units': ['J'], 'formula': 'J'},
         }
+        
+        # Flat parallel tables of the unit definitions, indexed through
+        # _unit_index, so lookups avoid the per-unit dicts
+        base_ids = {}
+        self._unit_index = {name: i for i, name in enumerate(self.units)}
+        self._factors = tuple(info.factor for info in self.units.values())
+        self._offsets = tuple(info.offset for info in self.units.values())
+        self._base_ids = tuple(base_ids.setdefault(info.base, len(base_ids))
+                               for info in self.units.values())
+        
+        # Specialized single-value converters per (from_unit, to_unit), filled on first use
+        self._converter_cache = {}
     
     def validate_units(self, value: float, from_unit: str, to_unit: str) -> bool:
         """
@@ -106,16 +262,18 @@ class DimensionalAnalyzer:
         Returns:
             bool: True if conversion is possible, False otherwise
         """
-        if from_unit not in self.units or to_unit not in self.units:
+        from_index = self._unit_index.get(from_unit)
+        to_index = self._unit_index.get(to_unit)
+        
+        if from_index is None or to_index is None:
             return False
         
         # Check if units have the same base unit
-        from_base = self.units[from_unit]['base']
-        to_base = self.units[to_unit]['base']
-        
-        return from_base == to_base
+        return self._base_ids[from_index] == self._base_ids[to_index]
     
-    def convert_units(self, value: float, from_unit: str, to_unit: str) -> Tuple[float, List[str]]:
+    def convert_units(self, value: float, from_unit: str, to_unit: str,
+                      return_steps: bool = True,
+                      deferred: bool = False) -> Tuple[float, Optional[List]]:
         """
         Convert a value from one unit to another with step-by-step analysis.
         
@@ -123,9 +281,13 @@ class DimensionalAnalyzer:
             value (float): Value to convert
             from_unit (str): Original unit
             to_unit (str): Target unit
+            return_steps (bool): Whether to build the step-by-step analysis (default: True)
+            deferred (bool): Return unformatted Step records instead of strings;
+                             format them later with render_steps (default: False)
             
         Returns:
-            Tuple[float, List[str]]: Converted value and step-by-step analysis
+            Tuple[float, Optional[List]]: Converted value and step-by-step analysis
+                                          (None if return_steps is False)
             
         Raises:
             ValueError: If conversion is not possible
@@ -133,58 +295,101 @@ class DimensionalAnalyzer:
         if not self.validate_units(value, from_unit, to_unit):
             raise ValueError(f"Cannot convert from {from_unit} to {to_unit}")
         
-        steps = []
-        steps.append(f"1. Original value: {value} {from_unit}")
+        if from_unit == to_unit:
+            if not return_steps:
+                return value, None
+            steps = [Step(5, (value, from_unit))]
+            return value, steps if deferred else render_steps(steps)
+        
+        converted_value = self._get_converter(from_unit, to_unit)(value)
+        
+        if not return_steps:
+            return converted_value, None
         
-        # Get unit information
+        # The explanation still walks through the base unit
         from_info = self.units[from_unit]
         to_info = self.units[to_unit]
         
-        steps.append(f"2. Base unit: {from_info['base']}")
+        base_value = value * from_info.factor + from_info.offset
+        target_base = base_value - to_info.offset
         
-        # Convert to base unit first
-        base_value = value * from_info['factor']
-        if 'offset' in from_info:
-            base_value += from_info['offset']
+        steps = [
+            Step(0, (value, from_unit)),
+            Step(1, (from_info.base,)),
+            Step(2, (value, from_info.factor, base_value)),
+            Step(3, (target_base, to_info.factor, converted_value)),
+            Step(4, (converted_value, to_unit)),
+        ]
         
-        steps.append(f"3. Convert to base unit: {value} x {from_info['factor']} = {base_value}")
-        
-        # Convert from base unit to target unit
-        if 'offset' in to_info:
-            base_value -= to_info['offset']
+        return converted_value, steps if deferred else render_steps(steps)
+    
+    def convert_units_batch(self, values: List[float], from_unit: str,
+                            to_unit: str) -> List[float]:
+        """
+        Convert a sequence of values from one unit to another.
         
-        converted_value = base_value / to_info['factor']
+        Args:
+            values (List[float]): Values to convert
+            from_unit (str): Original unit
+            to_unit (str): Target unit
+            
+        Returns:
+            List[float]: Converted values
+            
+        Raises:
+            ValueError: If conversion is not possible
+        """
+        if not self.validate_units(0.0, from_unit, to_unit):
+            raise ValueError(f"Cannot convert from {from_unit} to {to_unit}")
         
-        steps.append(f"4. Convert to target unit: {base_value} / {to_info['factor']} = {converted_value}")
-        steps.append(f"5. Final result: {converted_value} {to_unit}")
+        return list(map(self._get_converter(from_unit, to_unit), values))
+    
+    def _get_converter(self, from_unit: str, to_unit: str) -> Callable[[float], float]:
+        """
+        Get the cached single-value converter between two compatible units.
         
-        return converted_value, steps
+        Args:
+            from_unit (str): Original unit
+            to_unit (str): Target unit
+            
+        Returns:
+            Callable[[float], float]: Function converting one value
+        """
+        key = (from_unit, to_unit)
+        converter = self._converter_cache.get(key)
+        if converter is None:
+            from_index = self._unit_index[from_unit]
+            to_index = self._unit_index[to_unit]
+            converter = _make_converter(self._factors[from_index], self._offsets[from_index],
+                                        self._offsets[to_index], self._factors[to_index])
+            self._converter_cache[key] = converter
+        return converter
     
-    def analyze_molecular_weight_calculation(self, elements: Dict[str, int]) -> Dict[str, any]:
+    def analyze_molecular_weight_calculation(self, elements: Dict[str, int],
+                                             return_steps: bool = True) -> Dict[str, any]:
         """
         Perform dimensional analysis for molecular weight calculation.
         
         Args:
             elements (Dict[str, int]): Dictionary of elements and their counts
+            return_steps (bool): Whether to build the step-by-step analysis (default: True)
             
         Returns:
             Dict[str, any]: Analysis with steps and validation
         """
-        steps = []
-        total_weight = 0.0
-        
-        steps.append("Molecular Weight Calculation Analysis:")
-        steps.append("=" * 40)
-        
-        for element, count in elements.items():
-            # Get atomic weight (simplified - in real implementation, use atomic weights table)
-            atomic_weight = self._get_atomic_weight(element)
-            element_weight = atomic_weight * count
-            
-            steps.append(f" {element}: {count} atoms x {atomic_weight} g/mol = {element_weight} g/mol")
-            total_weight += element_weight
-        
-        steps.append(f" Total molecular weight: {total_weight} g/mol")
+        atomic_weights = [_ATOMIC_WEIGHTS.get(element, 0.0) for element in elements]
+        element_weights = [weight * count for weight, count in zip(atomic_weights, elements.values())]
+        total_weight = sum(element_weights)
+        
+        steps = None
+        if return_steps:
+            steps = [_MW_HEADER, _SEP40]
+            steps.extend(
+                f" {element}: {count} atoms x {atomic_weight} g/mol = {element_weight} g/mol"
+                for (element, count), atomic_weight, element_weight
+                in zip(elements.items(), atomic_weights, element_weights)
+            )
+            steps.append(f" Total molecular weight: {total_weight} g/mol")
         
         # Validate the calculation
         validation = self._validate_molecular_weight_calculation(elements, total_weight)
@@ -197,7 +402,8 @@ class DimensionalAnalyzer:
         }
     
     def analyze_concentration_conversion(self, from_unit: str, to_unit: str, 
-                                      value: float, solute_mw: float) -> Dict[str, any]:
+                                      value: float, solute_mw: float,
+                                      return_steps: bool = True) -> Dict[str, any]:
         """
         Perform dimensional analysis for concentration conversion.
         
@@ -206,29 +412,25 @@ class DimensionalAnalyzer:
             to_unit (str): Target concentration unit
             value (float): Original concentration value
             solute_mw (float): Molecular weight of solute
+            return_steps (bool): Whether to build the step-by-step analysis (default: True)
             
         Returns:
             Dict[str, any]: Analysis with steps and validation
         """
-        steps = []
-        steps.append(f"Concentration Conversion Analysis: {from_unit} -> {to_unit}")
-        steps.append("=" * 50)
-        
-        # Analyze the conversion based on unit types
-        if from_unit.upper() == 'M' and to_unit.lower() == 'm':
-            # Molarity to molality
-            steps.extend(self._analyze_molarity_to_molality(value, solute_mw))
-        elif from_unit.lower() == 'm' and to_unit.upper() == 'M':
-            # Molality to molarity
-            steps.extend(self._analyze_molality_to_molarity(value, solute_mw))
-        elif from_unit.upper() == 'M' and to_unit.upper() == 'N':
-            # Molarity to normality
-            steps.extend(self._analyze_molarity_to_normality(value))
-        elif from_unit.upper() == 'N' and to_unit.upper() == 'M':
-            # Normality to molarity
-            steps.extend(self._analyze_normality_to_molarity(value))
-        else:
-            steps.append(f"Unsupported conversion: {from_unit} -> {to_unit}")
+        steps = None
+        if return_steps:
+            steps = []
+            steps.append(f"Concentration Conversion Analysis: {from_unit} -> {to_unit}")
+            steps.append(_SEP50)
+            
+            # Analyze the conversion based on unit types
+            handler = _CONCENTRATION_ANALYSES.get((from_unit.strip(), to_unit.strip()))
+            if handler is None:
+                steps.append(f"Unsupported conversion: {from_unit} -> {to_unit}")
+            else:
+                method_name, uses_solute_mw = handler
+                analyze = getattr(self, method_name)
+                steps.extend(analyze(value, solute_mw) if uses_solute_mw else analyze(value))
         
         # Validate the conversion
         validation = self._validate_concentration_conversion(from_unit, to_unit, value)
@@ -243,12 +445,17 @@ class DimensionalAnalyzer:
         """Analyze molarity to molality conversion."""
         steps = []
         
+        mass_solute = molarity * solute_mw
+        mass_solvent = 1000 - mass_solute
+        kg_solvent = mass_solvent / 1000
+        molality = molarity / kg_solvent
+        
         steps.append(f"1. Original molarity: {molarity} mol/L")
         steps.append(f"2. Solute molecular weight: {solute_mw} g/mol")
         steps.append("3. Conversion steps:")
-        steps.append(f"    Mass of solute per liter: {molarity} mol/L x {solute_mw} g/mol = {molarity * solute_mw} g/L")
-        steps.append(f"    Mass of solvent per liter: 1000 g/L - {molarity * solute_mw} g/L = {1000 - molarity * solute_mw} g/L")
-        steps.append(f"    Molality: {molarity} mol / {(1000 - molarity * solute_mw) / 1000} kg = {molarity / ((1000 - molarity * solute_mw) / 1000)} mol/kg")
+        steps.append(f"    Mass of solute per liter: {molarity} mol/L x {solute_mw} g/mol = {mass_solute} g/L")
+        steps.append(f"    Mass of solvent per liter: 1000 g/L - {mass_solute} g/L = {mass_solvent} g/L")
+        steps.append(f"    Molality: {molarity} mol / {kg_solvent} kg = {molality} mol/kg")
         
         return steps
     
@@ -256,13 +463,18 @@ class DimensionalAnalyzer:
         """Analyze molality to molarity conversion."""
         steps = []
         
+        mass_solute = molality * solute_mw
+        total_mass = 1000 + mass_solute
+        volume_l = total_mass / 1000
+        molarity = molality / volume_l
+        
         steps.append(f"1. Original molality: {molality} mol/kg")
         steps.append(f"2. Solute molecular weight: {solute_mw} g/mol")
         steps.append("3. Conversion steps:")
-        steps.append(f"    Mass of solute per kg solvent: {molality} mol/kg x {solute_mw} g/mol = {molality * solute_mw} g/kg")
-        steps.append(f"    Total mass per kg solvent: 1000 g + {molality * solute_mw} g = {1000 + molality * solute_mw} g")
-        steps.append(f"    Volume per kg solvent: {(1000 + molality * solute_mw) / 1000} L")
-        steps.append(f"    Molarity: {molality} mol / {(1000 + molality * solute_mw) / 1000} L = {molality / ((1000 + molality * solute_mw) / 1000)} mol/L")
+        steps.append(f"    Mass of solute per kg solvent: {molality} mol/kg x {solute_mw} g/mol = {mass_solute} g/kg")
+        steps.append(f"    Total mass per kg solvent: 1000 g + {mass_solute} g = {total_mass} g")
+        steps.append(f"    Volume per kg solvent: {volume_l} L")
+        steps.append(f"    Molarity: {molality} mol / {volume_l} L = {molarity} mol/L")
         
         return steps
     
@@ -271,7 +483,7 @@ class DimensionalAnalyzer:
         steps = []
         
         steps.append(f"1. Original molarity: {molarity} mol/L")
-        steps.append("2. Normality calculation:")
+        steps.append(_NORMALITY_HEADER)
         steps.append(f"    Normality = Molarity x valence factor")
         steps.append(f"    Assuming valence factor = 1: {molarity} x 1 = {molarity} N")
         
@@ -282,7 +494,7 @@ class DimensionalAnalyzer:
         steps = []
         
         steps.append(f"1. Original normality: {normality} N")
-        steps.append("2. Molarity calculation:")
+        steps.append(_MOLARITY_HEADER)
         steps.append(f"    Molarity = Normality / valence factor")
         steps.append(f"    Assuming valence factor = 1: {normality} / 1 = {normality} M")
         
@@ -306,8 +518,7 @@ class DimensionalAnalyzer:
             validation['warnings'].append("Unusually high molecular weight - verify calculation")
         
         # Check for common elements
-        common_elements = {'H', 'C', 'N', 'O', 'S', 'P', 'Cl', 'Na', 'K', 'Ca', 'Mg', 'Fe'}
-        unusual_elements = [elem for elem in elements.keys() if elem not in common_elements]
+        unusual_elements = [elem for elem in elements if elem not in _COMMON_ELEMENTS]
         
         if unusual_elements:
             validation['warnings'].append(f"Unusual elements detected: {unusual_elements}")
@@ -343,58 +554,20 @@ class DimensionalAnalyzer:
         
         return validation
     
-    def _get_atomic_weight(self, element: str) -> float:
-        """Get atomic weight for an element (simplified)."""
-        # Simplified atomic weights - in real implementation, use comprehensive table
-        atomic_weights = {
-            'H': 1.008, 'C': 12.011, 'N': 14.007, 'O': 15.999,
-            'F': 18.998, 'Na': 22.990, 'Mg': 24.305, 'Al': 26.982,
-            'Si': 28.086, 'P': 30.974, 'S': 32.065, 'Cl': 35.453,
-            'K': 39.098, 'Ca': 40.078, 'Fe': 55.845, 'Cu': 63.546,
-            'Zn': 65.38, 'Br': 79.904, 'Ag': 107.868, 'I': 126.904
-        }
-        
-        return atomic_weights.get(element, 0.0)
-    
-    def get_unit_conversion_guide(self) -> Dict[str, List[str]]:
+    def get_unit_conversion_guide(self, mutable: bool = False) -> Mapping[str, Sequence[str]]:
         """
         Get a guide for common unit conversions.
         
+        The guide is a shared read-only mapping; pass mutable=True to get a
+        private copy that can be modified.
+        
+        Args:
+            mutable (bool): Whether to return an editable copy (default: False)
+            
         Returns:
-            Dict[str, List[str]]: Guide organized by unit type
+            Mapping[str, Sequence[str]]: Guide organized by unit type
         """
-        guide = {
-            'Length': [
-                '1 m = 100 cm = 1000 mm',
-                '1 km = 1000 m',
-                '1 in = 2.54 cm',
-                '1 ft = 30.48 cm',
-                '1 yd = 91.44 cm'
-            ],
-            'Volume': [
-                '1 L = 1000 mL',
-                '1 L = 1 dm',
-                '1 mL = 1 cm',
-                '1 gal = 3.785 L'
-            ],
-            'Mass': [
-                '1 kg = 1000 g',
-                '1 g = 1000 mg',
-                '1 lb = 453.592 g',
-                '1 oz = 28.3495 g'
-            ],
-            'Concentration': [
-                '1 M = 1 mol/L',
-                '1 m = 1 mol/kg',
-                '1 N = 1 eq/L',
-                '1 ppm = 1 mg/L (for dilute aqueous solutions)',
-                '1% = 10 g/L (for dilute aqueous solutions)'
-            ],
-            'Temperature': [
-                'K = C + 273.15',
-                'C = (F - 32) x 5/9',
-                'F = C x 9/5 + 32'
-            ]
-        }
+        if mutable:
+            return {unit_type: list(lines) for unit_type, lines in _UNIT_CONVERSION_GUIDE.items()}
         
-        return guide 
\ No newline at end of file
+        return _UNIT_CONVERSION_GUIDE
\ No newline at end of file
@@ -8,9 +8,116 @@ balancing with coefficient determination.
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+import sys
+from collections import Counter
+from functools import lru_cache, reduce
+from itertools import chain
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from parser import ChemicalFormulaParser
-from utils import extract_compounds_from_equation, validate_equation_format
+from utils import calculate_gcd, extract_compounds_from_equation, simplify_coefficients
+
+
+# Separator between the two sides of an equation, compiled once at import
+_EQUATION_SPLIT_RE = re.compile(r'->|=')
+
+
+@lru_cache(maxsize=256)
+def _integer_null_vector(matrix: Tuple[Tuple[int, ...], ...]) -> Tuple[int, ...]:
+    """
+    Find the smallest positive integer vector c with matrix @ c == 0.
+    
+    The matrix is reduced with fraction-free integer elimination (each row is
+    cross-multiplied by the pivot and divided by its gcd), so every value stays
+    an exact int and no rational arithmetic is needed. Solutions are cached by
+    matrix, so equations of the same shape (e.g. repeated combustion or
+    neutralization exercises) are solved once.
+    
+    Args:
+        matrix (Tuple[Tuple[int, ...], ...]): Formula matrix (rows=elements, cols=compounds)
+        
+    Returns:
+        Tuple[int, ...]: Integer coefficients, one per column
+        
+    Raises:
+        ValueError: If there is no nonzero solution, or no unique positive one
+    """
+    rows = [list(row) for row in matrix]
+    n_cols = len(matrix[0]) if matrix else 0
+    pivot_cols = []
+    pivot_row = 0
+    
+    for col in range(n_cols):
+        pivot = next((r for r in range(pivot_row, len(rows)) if rows[r][col]), None)
+        if pivot is None:
+            continue
+        rows[pivot_row], rows[pivot] = rows[pivot], rows[pivot_row]
+        lead_row = rows[pivot_row]
+        lead = lead_row[col]
+        for r in range(len(rows)):
+            scale = rows[r][col]
+            if r != pivot_row and scale:
+                row = [a * lead - scale * b for a, b in zip(rows[r], lead_row)]
+                divisor = reduce(calculate_gcd, map(abs, row))
+                rows[r] = [value // divisor for value in row] if divisor > 1 else row
+        pivot_cols.append(col)
+        pivot_row += 1
+    
+    free_cols = [col for col in range(n_cols) if col not in pivot_cols]
+    if not free_cols:
+        # Only the all-zero vector satisfies the matrix
+        raise ValueError("Equation cannot be balanced")
+    if len(free_cols) > 1:
+        raise ValueError("Equation does not have a unique balanced form")
+    
+    # Scale the free coefficient so every pivot coefficient divides exactly
+    free_col = free_cols[0]
+    leads = [rows[row][col] for row, col in enumerate(pivot_cols)]
+    scale = reduce(lambda a, b: a * b // calculate_gcd(a, b), map(abs, leads), 1)
+    coefficients = [0] * n_cols
+    coefficients[free_col] = scale
+    for row, col in enumerate(pivot_cols):
+        coefficients[col] = -rows[row][free_col] * scale // rows[row][col]
+    
+    if all(c < 0 for c in coefficients):
+        coefficients = [-c for c in coefficients]
+    if any(c <= 0 for c in coefficients):
+        raise ValueError("Equation cannot be balanced with positive coefficients")
+    
+    return tuple(simplify_coefficients(coefficients))
+
+
+@lru_cache(maxsize=256)
+def _tokenize_equation(equation: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    Split an equation into reactant and product formulas in a single pass.
+    
+    Args:
+        equation (str): Chemical equation ('->' or '=' between the sides)
+        
+    Returns:
+        Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]: Reactants and products,
+            or None if the equation format is invalid
+    """
+    if not equation:
+        return None
+    
+    parts = _EQUATION_SPLIT_RE.split(equation)
+    if len(parts) != 2 or not parts[0].strip() or not parts[1].strip():
+        return None
+    
+    reactants, products = (tuple(c.strip() for c in side.split('+') if c.strip())
+                           for side in parts)
+    return reactants, products
+
+
+class _EquationAnalysis(NamedTuple):
+    """Parsed form of an equation shared by balancing and analysis."""
+    reactants: Tuple[str, ...]
+    products: Tuple[str, ...]
+    compound_elements: Dict[str, Dict[str, int]]
+    matrix: Tuple[Tuple[int, ...], ...]
+    elements: List[str]
+    is_balanced: bool
 
 
 class EquationBalancer:
@@ -24,6 +131,73 @@ class EquationBalancer:
     def __init__(self):
         """Initialize the balancer with a formula parser."""
         self.parser = ChemicalFormulaParser()
+        
+        # Parsed element counts per formula string, shared by every analysis
+        self._parse_cache: Dict[str, Dict[str, int]] = {}
+        
+        # Parsed equations per (reactants, products), shared by balance_equation
+        # and get_equation_analysis
+        self._analysis_cache: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], _EquationAnalysis] = {}
+    
+    def _parse(self, formula: str) -> Dict[str, int]:
+        """
+        Parse a formula, reusing the result for formulas seen before.
+        
+        Args:
+            formula (str): Chemical formula
+            
+        Returns:
+            Dict[str, int]: Element counts (shared; do not modify)
+            
+        Raises:
+            ValueError: If the formula is invalid
+        """
+        elements = self._parse_cache.get(formula)
+        if elements is None:
+            # Intern the symbols so every cached formula shares one key object per element
+            elements = {sys.intern(element): count
+                        for element, count in self.parser.parse_formula(formula).items()}
+            self._parse_cache[formula] = elements
+        return elements
+    
+    def _analyze(self, reactants: Tuple[str, ...], products: Tuple[str, ...]) -> _EquationAnalysis:
+        """
+        Parse the compounds of an equation and build its formula matrix.
+        
+        Results are cached per (reactants, products) pair.
+        
+        Args:
+            reactants (Tuple[str, ...]): Reactant formulas
+            products (Tuple[str, ...]): Product formulas
+            
+        Returns:
+            _EquationAnalysis: Element counts, formula matrix and balance status
+            
+        Raises:
+            ValueError: If a compound cannot be parsed
+        """
+        key = (reactants, products)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            return analysis
+        
+        compound_elements = {}
+        try:
+            for compound in chain(reactants, products):
+                compound_elements[compound] = self._parse(compound)
+        except ValueError as e:
+            # The loop variable still names the compound that failed
+            raise ValueError(f"Invalid compound '{compound}': {e}")
+        
+        matrix, elements = self._formula_matrix(reactants, products, compound_elements)
+        
+        # Balanced when each element row sums to zero
+        is_balanced = not any(sum(row) for row in matrix)
+        
+        analysis = _EquationAnalysis(reactants, products, compound_elements,
+                                     matrix, elements, is_balanced)
+        self._analysis_cache[key] = analysis
+        return analysis
     
     def balance_equation(self, equation: str) -> str:
         """
@@ -41,32 +215,20 @@ class EquationBalancer:
         if not equation:
             raise ValueError("Empty equation provided")
         
-        # Validate equation format
-        if not validate_equation_format(equation):
+        # Validate the format and split into reactants and products
+        tokens = _tokenize_equation(equation)
+        if tokens is None:
             raise ValueError("Invalid equation format. Use 'Reactants -> Products'")
         
-        # Extract compounds from equation
-        compounds = extract_compounds_from_equation(equation)
-        if len(compounds) < 2:
-            raise ValueError("Equation must have at least one reactant and one product")
-        
-        # Split into reactants and products
-        parts = equation.split('->')
-        if len(parts) != 2:
+        if '->' not in equation:
             raise ValueError("Equation must contain exactly one arrow (->)")
         
-        reactants_str = parts[0].strip()
-        products_str = parts[1].strip()
-        
-        # Parse reactants and products
-        reactants = [c.strip() for c in reactants_str.split('+') if c.strip()]
-        products = [c.strip() for c in products_str.split('+') if c.strip()]
-        
+        reactants, products = tokens
         if not reactants or not products:
             raise ValueError("Equation must have at least one reactant and one product")
         
         # Balance the equation
-        balanced_reactants, balanced_products = self._balance_compounds(reactants, products)
+        balanced_reactants, balanced_products = self._balance_compounds(list(reactants), list(products))
         
         # Format the balanced equation
         balanced_equation = self._format_balanced_equation(balanced_reactants, balanced_products)
@@ -87,45 +249,29 @@ class EquationBalancer:
         Raises:
             ValueError: If balancing fails
         """
-        # For simplicity, implement a basic balancing algorithm
-        # This is a simplified version - real balancing is more complex
-        
-        # Parse all compounds to get elements
-        all_compounds = reactants + products
-        compound_elements = {}
-        
-        for compound in all_compounds:
-            try:
-                elements = self.parser.parse_formula(compound)
-                compound_elements[compound] = elements
-            except ValueError as e:
-                raise ValueError(f"Invalid compound '{compound}': {e}")
+        # Parse the compounds and build the formula matrix (cached per equation)
+        analysis = self._analyze(tuple(reactants), tuple(products))
         
-        # Simple balancing: try to find coefficients that work
-        # This is a basic implementation - real balancing requires solving systems of equations
-        
-        # For now, return the original equation with basic validation
         balanced_reactants = reactants.copy()
         balanced_products = products.copy()
         
         # Check if the equation is already balanced
-        if self._is_equation_balanced(reactants, products, compound_elements):
+        if analysis.is_balanced:
             return balanced_reactants, balanced_products
         
-        # Try simple balancing
+        # Solve for the coefficients
         try:
             balanced_reactants, balanced_products = self._simple_balance(
-                reactants, products, compound_elements
+                reactants, products, analysis.matrix
             )
             return balanced_reactants, balanced_products
-        except ValueError:
-            # If simple balancing fails, return with warning
-            raise ValueError("Complex balancing not implemented. Please check your equation manually.")
+        except ValueError as e:
+            raise ValueError(f"Unable to balance equation: {e}. Please check your equation manually.")
     
-    def _is_equation_balanced(self, reactants: List[str], products: List[str], 
-                            compound_elements: Dict[str, Dict[str, int]]) -> bool:
+    def _formula_matrix(self, reactants: List[str], products: List[str],
+                        compound_elements: Dict[str, Dict[str, int]]) -> Tuple[Tuple[Tuple[int, ...], ...], List[str]]:
         """
-        Check if an equation is already balanced.
+        Build the signed formula matrix of an equation.
         
         Args:
             reactants (List[str]): List of reactant formulas
@@ -133,142 +279,48 @@ class EquationBalancer:
             compound_elements (Dict[str, Dict[str, int]]): Element counts for each compound
             
         Returns:
-            bool: True if equation is balanced, False otherwise
+            Tuple[Tuple[Tuple[int, ...], ...], List[str]]: Matrix with one row per element
+                and one column per compound (product counts negated), and the element order
         """
-        # Count elements on each side
-        reactant_elements = {}
-        product_elements = {}
-        
-        # Count elements in reactants
-        for reactant in reactants:
-            elements = compound_elements[reactant]
-            for element, count in elements.items():
-                if element in reactant_elements:
-                    reactant_elements[element] += count
-                else:
-                    reactant_elements[element] = count
-        
-        # Count elements in products
-        for product in products:
-            elements = compound_elements[product]
-            for element, count in elements.items():
-                if element in product_elements:
-                    product_elements[element] += count
-                else:
-                    product_elements[element] = count
-        
-        # Check if all elements are balanced
-        all_elements = set(reactant_elements.keys()) | set(product_elements.keys())
-        
-        for element in all_elements:
-            reactant_count = reactant_elements.get(element, 0)
-            product_count = product_elements.get(element, 0)
-            
-            if reactant_count != product_count:
-                return False
-        
-        return True
+        elements = sorted({element for compound in chain(reactants, products)
+                           for element in compound_elements[compound]})
+        reactant_counts = [compound_elements[compound] for compound in reactants]
+        product_counts = [compound_elements[compound] for compound in products]
+        
+        matrix = []
+        for element in elements:
+            row = [counts.get(element, 0) for counts in reactant_counts]
+            row.extend(-counts.get(element, 0) for counts in product_counts)
+            matrix.append(tuple(row))
+        
+        # Tuples keep the matrix hashable for the solver cache
+        return tuple(matrix), elements
     
     def _simple_balance(self, reactants: List[str], products: List[str],
-                       compound_elements: Dict[str, Dict[str, int]]) -> Tuple[List[str], List[str]]:
+                       matrix: Tuple[Tuple[int, ...], ...]) -> Tuple[List[str], List[str]]:
         """
-        Perform simple balancing for common equations.
+        Balance an equation algebraically.
+        
+        The coefficients are the integer null space of the formula matrix
+        (rows=elements, cols=compounds, with product counts negated).
         
         Args:
             reactants (List[str]): List of reactant formulas
             products (List[str]): List of product formulas
-            compound_elements (Dict[str, Dict[str, int]]): Element counts for each compound
+            matrix (Tuple[Tuple[int, ...], ...]): Formula matrix from _formula_matrix
             
         Returns:
             Tuple[List[str], List[str]]: Balanced reactants and products
             
         Raises:
-            ValueError: If simple balancing fails
+            ValueError: If the equation cannot be balanced
         """
-        # Handle some common simple cases
-        if len(reactants) == 2 and len(products) == 1:
-            # A + B -> C type reaction
-            return self._balance_two_to_one(reactants, products, compound_elements)
-        elif len(reactants) == 1 and len(products) == 2:
-            # A -> B + C type reaction
-            return self._balance_one_to_two(reactants, products, compound_elements)
-        elif len(reactants) == 2 and len(products) == 2:
-            # A + B -> C + D type reaction
-            return self._balance_two_to_two(reactants, products, compound_elements)
-        else:
-            raise ValueError("Complex balancing not implemented for this equation type")
-    
-    def _balance_two_to_one(self, reactants: List[str], products: List[str],
-                           compound_elements: Dict[str, Dict[str, int]]) -> Tuple[List[str], List[str]]:
-        """
-        Balance A + B -> C type reactions.
+        coefficients = _integer_null_vector(matrix)
         
-        Args:
-            reactants (List[str]): Two reactant formulas
-            products (List[str]): One product formula
-            compound_elements (Dict[str, Dict[str, int]]): Element counts
-            
-        Returns:
-            Tuple[List[str], List[str]]: Balanced equation
-        """
-        # For simple cases, try coefficient of 1 for all compounds
-        balanced_reactants = [f"1{reactants[0]}", f"1{reactants[1]}"]
-        balanced_products = [f"1{products[0]}"]
-        
-        # Check if this works
-        if self._is_equation_balanced(reactants, products, compound_elements):
-            return balanced_reactants, balanced_products
-        
-        # If not, this is a complex case that needs more sophisticated balancing
-        raise ValueError("Complex balancing required for this equation")
-    
-    def _balance_one_to_two(self, reactants: List[str], products: List[str],
-                           compound_elements: Dict[str, Dict[str, int]]) -> Tuple[List[str], List[str]]:
-        """
-        Balance A -> B + C type reactions.
-        
-        Args:
-            reactants (List[str]): One reactant formula
-            products (List[str]): Two product formulas
-            compound_elements (Dict[str, Dict[str, int]]): Element counts
-            
-        Returns:
-            Tuple[List[str], List[str]]: Balanced equation
-        """
-        # For simple cases, try coefficient of 1 for all compounds
-        balanced_reactants = [f"1{reactants[0]}"]
-        balanced_products = [f"1{products[0]}", f"1{products[1]}"]
-        
-        # Check if this works
-        if self._is_equation_balanced(reactants, products, compound_elements):
-            return balanced_reactants, balanced_products
-        
-        # If not, this is a complex case that needs more sophisticated balancing
-        raise ValueError("Complex balancing required for this equation")
-    
-    def _balance_two_to_two(self, reactants: List[str], products: List[str],
-                           compound_elements: Dict[str, Dict[str, int]]) -> Tuple[List[str], List[str]]:
-        """
-        Balance A + B -> C + D type reactions.
-        
-        Args:
-            reactants (List[str]): Two reactant formulas
-            products (List[str]): Two product formulas
-            compound_elements (Dict[str, Dict[str, int]]): Element counts
-            
-        Returns:
-            Tuple[List[str], List[str]]: Balanced equation
-        """
-        # For simple cases, try coefficient of 1 for all compounds
-        balanced_reactants = [f"1{reactants[0]}", f"1{reactants[1]}"]
-        balanced_products = [f"1{products[0]}", f"1{products[1]}"]
-        
-        # Check if this works
-        if self._is_equation_balanced(reactants, products, compound_elements):
-            return balanced_reactants, balanced_products
-        
-        # If not, this is a complex case that needs more sophisticated balancing
-        raise ValueError("Complex balancing required for this equation")
+        # A coefficient of 1 is left implicit, as in standard notation
+        balanced = [compound if coefficient == 1 else f"{coefficient}{compound}"
+                    for coefficient, compound in zip(coefficients, chain(reactants, products))]
+        return balanced[:len(reactants)], balanced[len(reactants):]
     
     def _format_balanced_equation(self, reactants: List[str], products: List[str]) -> str:
         """
@@ -297,24 +349,7 @@ class EquationBalancer:
         Returns:
             List[str]: List of compound formulas
         """
-        if not equation:
-            return []
-        
-        # Split by arrow or equals sign
-        parts = re.split(r'->|=', equation)
-        if len(parts) != 2:
-            return []
-        
-        reactants, products = parts
-        
-        # Extract compounds (split by + and clean up)
-        compounds = []
-        
-        for side in [reactants, products]:
-            side_compounds = [c.strip() for c in side.split('+')]
-            compounds.extend([c for c in side_compounds if c])
-        
-        return compounds
+        return extract_compounds_from_equation(equation)
     
     def validate_equation(self, equation: str) -> bool:
         """
@@ -327,21 +362,21 @@ class EquationBalancer:
             bool: True if equation is valid, False otherwise
         """
         try:
-            if not validate_equation_format(equation):
+            tokens = _tokenize_equation(equation)
+            if tokens is None:
                 return False
             
-            # Try to extract compounds
-            compounds = self.extract_compounds_from_equation(equation)
-            if len(compounds) < 2:
+            reactants, products = tokens
+            if not reactants or not products:
                 return False
             
             # Try to parse each compound
-            for compound in compounds:
-                self.parser.parse_formula(compound)
+            for compound in chain(reactants, products):
+                self._parse(compound)
             
             return True
             
-        except (ValueError, Exception):
+        except ValueError:
             return False
     
     def get_equation_analysis(self, equation: str) -> Dict[str, any]:
@@ -355,7 +390,8 @@ class EquationBalancer:
             Dict[str, any]: Analysis including compounds, elements, and balance status
         """
         try:
-            if not validate_equation_format(equation):
+            tokens = _tokenize_equation(equation)
+            if tokens is None:
                 return {
                     'equation': equation,
                     'is_valid': False,
@@ -365,52 +401,42 @@ class EquationBalancer:
                     'is_balanced': False
                 }
             
-            # Extract compounds
-            compounds = extract_compounds_from_equation(equation)
+            reactants, products = tokens
+            compounds = [*reactants, *products]
+            
+            # Parse all compounds (shared with balance_equation)
+            try:
+                analysis = self._analyze(reactants, products)
+            except ValueError as e:
+                return {
+                    'equation': equation,
+                    'is_valid': False,
+                    'error': str(e),
+                    'compounds': compounds,
+                    'elements': {},
+                    'is_balanced': False
+                }
             
-            # Parse all compounds
-            compound_elements = {}
-            all_elements = {}
+            compound_elements = analysis.compound_elements
             
+            # Add to total element counts
+            all_elements = Counter()
             for compound in compounds:
-                try:
-                    elements = self.parser.parse_formula(compound)
-                    compound_elements[compound] = elements
-                    
-                    # Add to total element counts
-                    for element, count in elements.items():
-                        if element in all_elements:
-                            all_elements[element] += count
-                        else:
-                            all_elements[element] = count
-                            
-                except ValueError as e:
-                    return {
-                        'equation': equation,
-                        'is_valid': False,
-                        'error': f"Invalid compound '{compound}': {e}",
-                        'compounds': compounds,
-                        'elements': {},
-                        'is_balanced': False
-                    }
+                all_elements.update(compound_elements[compound])
             
             # Check if balanced
-            parts = equation.split('->')
-            if len(parts) == 2:
-                reactants = [c.strip() for c in parts[0].split('+') if c.strip()]
-                products = [c.strip() for c in parts[1].split('+') if c.strip()]
-                is_balanced = self._is_equation_balanced(reactants, products, compound_elements)
-            else:
-                is_balanced = False
+            is_balanced = analysis.is_balanced if '->' in equation else False
             
             return {
                 'equation': equation,
                 'is_valid': True,
                 'error': None,
                 'compounds': compounds,
-                'elements': all_elements,
+                'elements': dict(all_elements),
                 'is_balanced': is_balanced,
-                'compound_elements': compound_elements
+                # Copy the inner dicts too; they are the cached parse results
+                'compound_elements': {compound: dict(elements)
+                                      for compound, elements in compound_elements.items()}
             }
             
         except Exception as e:
@@ -12,16 +12,10 @@ equation balancing, stoichiometry, and concentration conversions.
 
 import sys
 import os
+from functools import cached_property
 from typing import Optional
 
-# Import our custom modules
-from parser import ChemicalFormulaParser
-from molecular_calculator import MolecularCalculator
-from equation_balancer import EquationBalancer
-from stoichiometry import StoichiometryCalculator
-from concentration_converter import ConcentrationConverter
-from dimensional_analysis import DimensionalAnalyzer
-from report_generator import ReportGenerator
+# Import our custom modules (the calculators are imported on first use)
 from utils import clear_screen, validate_file_path
 
 
@@ -33,15 +27,49 @@ class ChemistryCLI:
     chemical analysis tools through a menu-driven system.
     """
     
-    def __init__(self):
-        """Initialize the CLI with all necessary components."""
-        self.parser = ChemicalFormulaParser()
-        self.molecular_calc = MolecularCalculator()
-        self.equation_balancer = EquationBalancer()
-        self.stoichiometry_calc = StoichiometryCalculator()
-        self.concentration_converter = ConcentrationConverter()
-        self.dimensional_analyzer = DimensionalAnalyzer()
-        self.report_generator = ReportGenerator()
+    # Each component is imported and created the first time a menu option needs it
+    
+    @cached_property
+    def parser(self):
+        """Formula parser."""
+        from parser import ChemicalFormulaParser
+        return ChemicalFormulaParser()
+    
+    @cached_property
+    def molecular_calc(self):
+        """Molecular weight calculator."""
+        from molecular_calculator import MolecularCalculator
+        return MolecularCalculator()
+    
+    @cached_property
+    def equation_balancer(self):
+        """Chemical equation balancer."""
+        from equation_balancer import EquationBalancer
+        return EquationBalancer()
+    
+    @cached_property
+    def stoichiometry_calc(self):
+        """Stoichiometry calculator."""
+        from stoichiometry import StoichiometryCalculator
+        return StoichiometryCalculator()
+    
+    @cached_property
+    def concentration_converter(self):
+        """Concentration unit converter."""
+        from concentration_converter import ConcentrationConverter
+        return ConcentrationConverter()
+    
+    @cached_property
+    def dimensional_analyzer(self):
+        """Dimensional analyzer."""
+        from dimensional_analysis import DimensionalAnalyzer
+        return DimensionalAnalyzer()
+    
+    @cached_property
+    def report_generator(self):
+        """Report generator."""
+        from report_generator import ReportGenerator
+        return ReportGenerator()
         
     def display_welcome(self):
         """Display the welcome message and main menu."""
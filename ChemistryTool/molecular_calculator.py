@@ -9,8 +9,125 @@ and provides comprehensive molecular analysis.
 """
 
 import math
-from typing import Dict, List, Tuple, Optional
-from utils import calculate_gcd, simplify_ratio
+from functools import reduce
+from types import MappingProxyType
+from typing import Dict, Final, Iterable, List, Mapping, NamedTuple, Optional
+
+
+# Standard atomic weights (g/mol) - simplified set for common elements
+ATOMIC_WEIGHTS: Final[Mapping[str, float]] = MappingProxyType({
+    'H': 1.008,    # Hydrogen
+    'He': 4.003,   # Helium
+    'Li': 6.941,   # Lithium
+    'Be': 9.012,   # Beryllium
+    'B': 10.811,   # Boron
+    'C': 12.011,   # Carbon
+    'N': 14.007,   # Nitrogen
+    'O': 15.999,   # Oxygen
+    'F': 18.998,   # Fluorine
+    'Ne': 20.180,  # Neon
+    'Na': 22.990,  # Sodium
+    'Mg': 24.305,  # Magnesium
+    'Al': 26.982,  # Aluminum
+    'Si': 28.086,  # Silicon
+    'P': 30.974,   # Phosphorus
+    'S': 32.065,   # Sulfur
+    'Cl': 35.453,  # Chlorine
+    'Ar': 39.948,  # Argon
+    'K': 39.098,   # Potassium
+    'Ca': 40.078,  # Calcium
+    'Sc': 44.956,  # Scandium
+    'Ti': 47.867,  # Titanium
+    'V': 50.942,   # Vanadium
+    'Cr': 51.996,  # Chromium
+    'Mn': 54.938,  # Manganese
+    'Fe': 55.845,  # Iron
+    'Co': 58.933,  # Cobalt
+    'Ni': 58.693,  # Nickel
+    'Cu': 63.546,  # Copper
+    'Zn': 65.38,   # Zinc
+    'Ga': 69.723,  # Gallium
+    'Ge': 72.64,   # Germanium
+    'As': 74.922,  # Arsenic
+    'Se': 78.96,   # Selenium
+    'Br': 79.904,  # Bromine
+    'Kr': 83.80,   # Krypton
+    'Rb': 85.468,  # Rubidium
+    'Sr': 87.62,   # Strontium
+    'Y': 88.906,   # Yttrium
+    'Zr': 91.224,  # Zirconium
+    'Nb': 92.906,  # Niobium
+    'Mo': 95.94,   # Molybdenum
+    'Tc': 98.0,    # Technetium
+    'Ru': 101.07,  # Ruthenium
+    'Rh': 102.906, # Rhodium
+    'Pd': 106.42,  # Palladium
+    'Ag': 107.868, # Silver
+    'Cd': 112.411, # Cadmium
+    'In': 114.818, # Indium
+    'Sn': 118.710, # Tin
+    'Sb': 121.760, # Antimony
+    'Te': 127.60,  # Tellurium
+    'I': 126.904,  # Iodine
+    'Xe': 131.293, # Xenon
+    'Cs': 132.905, # Cesium
+    'Ba': 137.327, # Barium
+    'La': 138.905, # Lanthanum
+    'Ce': 140.116, # Cerium
+    'Pr': 140.908, # Praseodymium
+    'Nd': 144.242, # Neodymium
+    'Pm': 145.0,   # Promethium
+    'Sm': 150.36,  # Samarium
+    'Eu': 151.964, # Europium
+    'Gd': 157.25,  # Gadolinium
+    'Tb': 158.925, # Terbium
+    'Dy': 162.500, # Dysprosium
+    'Ho': 164.930, # Holmium
+    'Er': 167.259, # Erbium
+    'Tm': 168.934, # Thulium
+    'Yb': 173.04,  # Ytterbium
+    'Lu': 174.967, # Lutetium
+    'Hf': 178.49,  # Hafnium
+    'Ta': 180.948, # Tantalum
+    'W': 183.84,   # Tungsten
+    'Re': 186.207, # Rhenium
+    'Os': 190.23,  # Osmium
+    'Ir': 192.217, # Iridium
+    'Pt': 195.078, # Platinum
+    'Au': 196.967, # Gold
+    'Hg': 200.59,  # Mercury
+    'Tl': 204.383, # Thallium
+    'Pb': 207.2,   # Lead
+    'Bi': 208.980, # Bismuth
+    'Po': 209.0,   # Polonium
+    'At': 210.0,   # Astatine
+    'Rn': 222.0,   # Radon
+    'Fr': 223.0,   # Francium
+    'Ra': 226.0,   # Radium
+    'Ac': 227.0,   # Actinium
+    'Th': 232.038, # Thorium
+    'Pa': 231.036, # Protactinium
+    'U': 238.029,  # Uranium
+    'Np': 237.0,   # Neptunium
+    'Pu': 244.0,   # Plutonium
+    'Am': 243.0,   # Americium
+    'Cm': 247.0,   # Curium
+    'Bk': 247.0,   # Berkelium
+    'Cf': 251.0,   # Californium
+    'Es': 252.0,   # Einsteinium
+    'Fm': 257.0    # Fermium
+})
+
+
+class MolecularAnalysis(NamedTuple):
+    """Molecular analysis of a compound, as returned by get_molecular_analysis."""
+    molecular_weight: float
+    empirical_formula: str
+    percent_composition: Dict[str, float]
+    total_atoms: int
+    unique_elements: int
+    is_valid: bool
+    error: Optional[str]
 
 
 class MolecularCalculator:
@@ -22,111 +139,8 @@ class MolecularCalculator:
     molecular formulas.
     """
     
-    def __init__(self):
-        """Initialize the calculator with standard atomic weights."""
-        # Standard atomic weights (g/mol) - simplified set for common elements
-        self.atomic_weights = {
-            'H': 1.008,    # Hydrogen
-            'He': 4.003,   # Helium
-            'Li': 6.941,   # Lithium
-            'Be': 9.012,   # Beryllium
-            'B': 10.811,   # Boron
-            'C': 12.011,   # Carbon
-            'N': 14.007,   # Nitrogen
-            'O': 15.999,   # Oxygen
-            'F': 18.998,   # Fluorine
-            'Ne': 20.180,  # Neon
-            'Na': 22.990,  # Sodium
-            'Mg': 24.305,  # Magnesium
-            'Al': 26.982,  # Aluminum
-            'Si': 28.086,  # Silicon
-            'P': 30.974,   # Phosphorus
-            'S': 32.065,   # Sulfur
-            'Cl': 35.453,  # Chlorine
-            'Ar': 39.948,  # Argon
-            'K': 39.098,   # Potassium
-            'Ca': 40.078,  # Calcium
-            'Sc': 44.956,  # Scandium
-            'Ti': 47.867,  # Titanium
-            'V': 50.942,   # Vanadium
-            'Cr': 51.996,  # Chromium
-            'Mn': 54.938,  # Manganese
-            'Fe': 55.845,  # Iron
-            'Co': 58.933,  # Cobalt
-            'Ni': 58.693,  # Nickel
-            'Cu': 63.546,  # Copper
-            'Zn': 65.38,   # Zinc
-            'Ga': 69.723,  # Gallium
-            'Ge': 72.64,   # Germanium
-            'As': 74.922,  # Arsenic
-            'Se': 78.96,   # Selenium
-            'Br': 79.904,  # Bromine
-            'Kr': 83.80,   # Krypton
-            'Rb': 85.468,  # Rubidium
-            'Sr': 87.62,   # Strontium
-            'Y': 88.906,   # Yttrium
-            'Zr': 91.224,  # Zirconium
-            'Nb': 92.906,  # Niobium
-            'Mo': 95.94,   # Molybdenum
-            'Tc': 98.0,    # Technetium
-            'Ru': 101.07,  # Ruthenium
-            'Rh': 102.906, # Rhodium
-            'Pd': 106.42,  # Palladium
-            'Ag': 107.868, # Silver
-            'Cd': 112.411, # Cadmium
-            'In': 114.818, # Indium
-            'Sn': 118.710, # Tin
-            'Sb': 121.760, # Antimony
-            'Te': 127.60,  # Tellurium
-            'I': 126.904,  # Iodine
-            'Xe': 131.293, # Xenon
-            'Cs': 132.905, # Cesium
-            'Ba': 137.327, # Barium
-            'La': 138.905, # Lanthanum
-            'Ce': 140.116, # Cerium
-            'Pr': 140.908, # Praseodymium
-            'Nd': 144.242, # Neodymium
-            'Pm': 145.0,   # Promethium
-            'Sm': 150.36,  # Samarium
-            'Eu': 151.964, # Europium
-            'Gd': 157.25,  # Gadolinium
-            'Tb': 158.925, # Terbium
-            'Dy': 162.500, # Dysprosium
-            'Ho': 164.930, # Holmium
-            'Er': 167.259, # Erbium
-            'Tm': 168.934, # Thulium
-            'Yb': 173.04,  # Ytterbium
-            'Lu': 174.967, # Lutetium
-            'Hf': 178.49,  # Hafnium
-            'Ta': 180.948, # Tantalum
-            'W': 183.84,   # Tungsten
-            'Re': 186.207, # Rhenium
-            'Os': 190.23,  # Osmium
-            'Ir': 192.217, # Iridium
-            'Pt': 195.078, # Platinum
-            'Au': 196.967, # Gold
-            'Hg': 200.59,  # Mercury
-            'Tl': 204.383, # Thallium
-            'Pb': 207.2,   # Lead
-            'Bi': 208.980, # Bismuth
-            'Po': 209.0,   # Polonium
-            'At': 210.0,   # Astatine
-            'Rn': 222.0,   # Radon
-            'Fr': 223.0,   # Francium
-            'Ra': 226.0,   # Radium
-            'Ac': 227.0,   # Actinium
-            'Th': 232.038, # Thorium
-            'Pa': 231.036, # Protactinium
-            'U': 238.029,  # Uranium
-            'Np': 237.0,   # Neptunium
-            'Pu': 244.0,   # Plutonium
-            'Am': 243.0,   # Americium
-            'Cm': 247.0,   # Curium
-            'Bk': 247.0,   # Berkelium
-            'Cf': 251.0,   # Californium
-            'Es': 252.0,   # Einsteinium
-            'Fm': 257.0    # Fermium
-        }
+    # Shared, read-only table; nothing is built per instance
+    atomic_weights = ATOMIC_WEIGHTS
     
     def calculate_molecular_weight(self, elements: Dict[str, int]) -> float:
         """
@@ -144,16 +158,43 @@ class MolecularCalculator:
         if not elements:
             raise ValueError("No elements provided for molecular weight calculation")
         
-        total_weight = 0.0
+        atomic_weights = self.atomic_weights
+        try:
+            weights = [atomic_weights[element] for element in elements]
+        except KeyError as e:
+            raise ValueError(f"Unknown element: {e.args[0]}")
+        
+        return sum([weight * count for weight, count in zip(weights, elements.values())], 0.0)
+    
+    def calculate_molecular_weights_batch(self, compounds: Iterable[Dict[str, int]]) -> List[float]:
+        """
+        Calculate the molecular weights of many compounds in one pass.
         
-        for element, count in elements.items():
-            if element not in self.atomic_weights:
-                raise ValueError(f"Unknown element: {element}")
+        Intended for the values of ChemicalFormulaParser.parse_file or
+        parse_formulas; the weight table is looked up once for the whole batch.
+        
+        Args:
+            compounds (Iterable[Dict[str, int]]): Element counts for each compound
+            
+        Returns:
+            List[float]: Molecular weights in g/mol, in input order
             
-            atomic_weight = self.atomic_weights[element]
-            total_weight += atomic_weight * count
+        Raises:
+            ValueError: If a compound is empty or contains an unknown element
+        """
+        atomic_weights = self.atomic_weights
+        weights = []
         
-        return total_weight
+        for elements in compounds:
+            if not elements:
+                raise ValueError("No elements provided for molecular weight calculation")
+            try:
+                weights.append(sum([atomic_weights[element] * count
+                                    for element, count in elements.items()], 0.0))
+            except KeyError as e:
+                raise ValueError(f"Unknown element: {e.args[0]}")
+        
+        return weights
     
     def get_empirical_formula(self, elements: Dict[str, int]) -> str:
         """
@@ -177,9 +218,7 @@ class MolecularCalculator:
             raise ValueError("No element counts provided")
         
         # Calculate GCD of all counts
-        gcd = counts[0]
-        for count in counts[1:]:
-            gcd = calculate_gcd(gcd, count)
+        gcd = reduce(math.gcd, counts)
         
         # Divide all counts by the GCD to get empirical formula
         empirical_elements = {}
@@ -201,20 +240,11 @@ class MolecularCalculator:
         Returns:
             str: Formatted chemical formula
         """
-        if not elements:
-            return ""
-        
         # Sort elements by symbol for consistent output
-        sorted_elements = sorted(elements.items())
-        
-        formula_parts = []
-        for element, count in sorted_elements:
-            if count == 1:
-                formula_parts.append(element)
-            else:
-                formula_parts.append(f"{element}{count}")
-        
-        return "".join(formula_parts)
+        return "".join(
+            element if count == 1 else f"{element}{count}"
+            for element, count in sorted(elements.items())
+        )
     
     def calculate_percent_composition(self, elements: Dict[str, int]) -> Dict[str, float]:
         """
@@ -232,16 +262,31 @@ class MolecularCalculator:
         if not elements:
             raise ValueError("No elements provided for percent composition calculation")
         
-        molecular_weight = self.calculate_molecular_weight(elements)
-        
-        percent_composition = {}
-        for element, count in elements.items():
-            atomic_weight = self.atomic_weights[element]
-            element_mass = atomic_weight * count
-            percent = (element_mass / molecular_weight) * 100
-            percent_composition[element] = percent
+        # Each element's mass is computed once and reused for the total
+        element_masses = self._element_masses(elements)
+        molecular_weight = sum(element_masses.values(), 0.0)
+        return {element: (element_mass / molecular_weight) * 100
+                for element, element_mass in element_masses.items()}
+    
+    def _element_masses(self, elements: Dict[str, int]) -> Dict[str, float]:
+        """
+        Calculate the total mass each element contributes to a compound.
         
-        return percent_composition
+        Args:
+            elements (Dict[str, int]): Dictionary mapping element symbols to their counts
+            
+        Returns:
+            Dict[str, float]: Dictionary mapping element symbols to their mass in g/mol
+            
+        Raises:
+            ValueError: If any element is not found in the atomic weights table
+        """
+        atomic_weights = self.atomic_weights
+        try:
+            return {element: atomic_weights[element] * count
+                    for element, count in elements.items()}
+        except KeyError as e:
+            raise ValueError(f"Unknown element: {e.args[0]}")
     
     def calculate_moles_from_mass(self, mass: float, elements: Dict[str, int]) -> float:
         """
@@ -291,44 +336,91 @@ class MolecularCalculator:
         
         return moles * molecular_weight
     
-    def get_molecular_analysis(self, elements: Dict[str, int]) -> Dict[str, any]:
+    def calculate_moles_from_masses(self, masses: Iterable[float], elements: Dict[str, int]) -> List[float]:
         """
-        Get a comprehensive molecular analysis.
+        Calculate the number of moles for many masses of the same compound.
+        
+        The molecular weight is calculated once for the whole batch.
         
         Args:
+            masses (Iterable[float]): Masses in grams
             elements (Dict[str, int]): Dictionary mapping element symbols to their counts
             
         Returns:
-            Dict[str, any]: Comprehensive analysis including molecular weight, 
-                           empirical formula, and percent composition
+            List[float]: Number of moles for each mass, in input order
+            
+        Raises:
+            ValueError: If any mass is negative or molecular weight calculation fails
         """
-        try:
-            molecular_weight = self.calculate_molecular_weight(elements)
-            empirical_formula = self.get_empirical_formula(elements)
-            percent_composition = self.calculate_percent_composition(elements)
+        masses = list(masses)
+        if any(mass < 0 for mass in masses):
+            raise ValueError("Mass cannot be negative")
+        
+        molecular_weight = self.calculate_molecular_weight(elements)
+        
+        if molecular_weight <= 0:
+            raise ValueError("Invalid molecular weight")
+        
+        return [mass / molecular_weight for mass in masses]
+    
+    def calculate_masses_from_moles(self, moles: Iterable[float], elements: Dict[str, int]) -> List[float]:
+        """
+        Calculate the mass for many mole amounts of the same compound.
+        
+        The molecular weight is calculated once for the whole batch.
+        
+        Args:
+            moles (Iterable[float]): Numbers of moles
+            elements (Dict[str, int]): Dictionary mapping element symbols to their counts
             
-            analysis = {
-                'molecular_weight': molecular_weight,
-                'empirical_formula': empirical_formula,
-                'percent_composition': percent_composition,
-                'total_atoms': sum(elements.values()),
-                'unique_elements': len(elements),
-                'is_valid': True,
-                'error': None
-            }
+        Returns:
+            List[float]: Mass in grams for each amount, in input order
             
-            return analysis
+        Raises:
+            ValueError: If any amount is negative or molecular weight calculation fails
+        """
+        moles = list(moles)
+        if any(amount < 0 for amount in moles):
+            raise ValueError("Moles cannot be negative")
+        
+        molecular_weight = self.calculate_molecular_weight(elements)
+        
+        if molecular_weight <= 0:
+            raise ValueError("Invalid molecular weight")
+        
+        return [amount * molecular_weight for amount in moles]
+    
+    def get_molecular_analysis(self, elements: Dict[str, int], as_record: bool = False):
+        """
+        Get a comprehensive molecular analysis.
+        
+        Args:
+            elements (Dict[str, int]): Dictionary mapping element symbols to their counts
+            as_record (bool): Return a MolecularAnalysis instead of a dictionary
             
+        Returns:
+            Dict[str, any] or MolecularAnalysis: Comprehensive analysis including molecular weight, 
+                                                 empirical formula, and percent composition
+        """
+        # Validate once; weight and percent composition then share the element masses
+        try:
+            if not elements:
+                raise ValueError("No elements provided for molecular weight calculation")
+            element_masses = self._element_masses(elements)
         except ValueError as e:
-            return {
-                'molecular_weight': 0.0,
-                'empirical_formula': "",
-                'percent_composition': {},
-                'total_atoms': 0,
-                'unique_elements': 0,
-                'is_valid': False,
-                'error': str(e)
-            }
+            analysis = MolecularAnalysis(0.0, "", {}, 0, 0, False, str(e))
+            return analysis if as_record else analysis._asdict()
+        
+        molecular_weight = sum(element_masses.values(), 0.0)
+        empirical_formula = self.get_empirical_formula(elements)
+        percent_composition = {element: (element_mass / molecular_weight) * 100
+                               for element, element_mass in element_masses.items()}
+        
+        analysis = MolecularAnalysis(
+            molecular_weight, empirical_formula, percent_composition,
+            sum(elements.values()), len(elements), True, None
+        )
+        return analysis if as_record else analysis._asdict()
     
     def validate_atomic_weight(self, element: str) -> bool:
         """
@@ -9,8 +9,152 @@ provides validation for chemical formulas.
 
 import re
 import csv
-from typing import Dict, List, Tuple, Optional
-from utils import validate_chemical_symbol, format_chemical_formula
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional
+from utils import ELEMENT_SYMBOLS, format_chemical_formula
+
+
+# Patterns used on every parse, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+# Deletes every ASCII character that \s matches, without running the regex engine
+_ASCII_WHITESPACE_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c).isspace()))
+_LEADING_COEFFICIENT_RE = re.compile(r'^\d+')
+_FORMULA_CANDIDATE_RE = re.compile(r'\b(?:[A-Z][a-z]?\d*)+\b')
+_ELEMENT_TOKEN_RE = re.compile(r'([A-Z][a-z]?)(\d*)')
+_FORMULA_RE = re.compile(r'(?:[A-Z][a-z]?\d*)+')
+# Element with count, opening parenthesis, or closing parenthesis with multiplier
+_COMPLEX_TOKEN_RE = re.compile(r'([A-Z][a-z]?)(\d*)|(\()|\)(\d*)')
+# A stripped, non-empty line that is not a '#' comment
+_CONTENT_LINE_RE = re.compile(r'^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+# Formulas handed to each worker process by parse_formulas
+_PARALLEL_CHUNK_SIZE = 1000
+
+
+class FormulaSummary(NamedTuple):
+    """Summary of a chemical formula, as returned by get_formula_summary."""
+    formula: str
+    elements: Dict[str, int]
+    total_atoms: int
+    unique_elements: int
+    is_valid: bool
+    error: Optional[str]
+
+
+@lru_cache(maxsize=8192)
+def _parse_formula_cached(formula: str, valid_elements: frozenset) -> Tuple[Tuple[str, int], ...]:
+    """
+    Parse a raw formula into immutable (element, count) pairs, memoized across parsers.
+    
+    Args:
+        formula (str): Raw, non-empty chemical formula as passed to parse_formula
+        valid_elements (frozenset): Element symbols accepted by the calling parser
+        
+    Returns:
+        Tuple[Tuple[str, int], ...]: Element symbols and counts in first-seen order
+        
+    Raises:
+        ValueError: If the formula is invalid or contains unrecognized elements
+    """
+    # Plain ASCII alphanumerics have nothing to strip or space out, so skip formatting
+    if not (formula.isascii() and formula.isalnum()):
+        # Clean and format the formula
+        formula = format_chemical_formula(formula)
+        
+        # Remove any spaces and parentheses for now (simplified parsing)
+        if formula.isascii():
+            formula = formula.translate(_ASCII_WHITESPACE_TABLE)
+        else:
+            formula = _WHITESPACE_RE.sub('', formula)
+    
+    # Check the shape of the whole formula in C before tokenizing it
+    if not _FORMULA_RE.fullmatch(formula):
+        _raise_parse_error(formula, valid_elements)
+    
+    # Find all element symbols and their counts
+    elements = {}
+    for element_symbol, count_str in _ELEMENT_TOKEN_RE.findall(formula):
+        if element_symbol not in valid_elements:
+            raise ValueError(f"Invalid element symbol: {element_symbol}")
+        
+        count = int(count_str) if count_str else 1
+        elements[element_symbol] = elements.get(element_symbol, 0) + count
+    
+    if not elements:
+        raise ValueError("No valid elements found in formula")
+    
+    return tuple(elements.items())
+
+
+@lru_cache(maxsize=2048)
+def _summarize_formula_cached(formula: str, valid_elements: frozenset) -> Tuple[Tuple[Tuple[str, int], ...], Optional[str]]:
+    """
+    Parse a raw formula for get_formula_summary, memoizing failures as well as successes.
+    
+    Args:
+        formula (str): Raw, non-empty chemical formula
+        valid_elements (frozenset): Element symbols accepted by the calling parser
+        
+    Returns:
+        Tuple: (element, count) pairs and None, or an empty tuple and the error message
+    """
+    try:
+        return _parse_formula_cached(formula, valid_elements), None
+    except ValueError as e:
+        return (), str(e)
+
+
+def _raise_parse_error(formula: str, valid_elements: frozenset) -> None:
+    """
+    Raise the error for the first problem in a formula that failed to tokenize.
+    
+    Args:
+        formula (str): Cleaned formula that the element tokens do not fully cover
+        valid_elements (frozenset): Element symbols accepted by the calling parser
+        
+    Raises:
+        ValueError: Always, describing the first invalid symbol or character
+    """
+    position = 0
+    while position < len(formula):
+        match = _ELEMENT_TOKEN_RE.match(formula, position)
+        if match:
+            if match.group(1) not in valid_elements:
+                raise ValueError(f"Invalid element symbol: {match.group(1)}")
+            position = match.end()
+            continue
+        
+        char = formula[position]
+        if char.isupper():
+            raise ValueError(f"Invalid element symbol: {char}")
+        if char.isalpha():
+            raise ValueError(f"Invalid element symbol at position {position}: {char}")
+        raise ValueError(f"Unexpected character at position {position}: {char}")
+    
+    raise ValueError("No valid elements found in formula")
+
+
+def _parse_chunk(formulas: List[str], valid_elements: frozenset) -> List[Tuple[str, Tuple[Tuple[str, int], ...]]]:
+    """
+    Parse a chunk of formulas in a worker process, leaving out invalid ones.
+    
+    Args:
+        formulas (List[str]): Chemical formulas to parse
+        valid_elements (frozenset): Element symbols accepted by the calling parser
+        
+    Returns:
+        List[Tuple[str, Tuple[Tuple[str, int], ...]]]: Each valid formula with its element counts
+    """
+    parsed = []
+    for formula in formulas:
+        if not formula:
+            continue
+        try:
+            parsed.append((formula, _parse_formula_cached(formula, valid_elements)))
+        except ValueError:
+            continue
+    return parsed
 
 
 class ChemicalFormulaParser:
@@ -22,32 +166,12 @@ class ChemicalFormulaParser:
     """
     
     def __init__(self):
-        """Initialize the parser with element validation patterns."""
-        # Common element symbols (first letter uppercase, second lowercase if present)
-        self.element_symbols = {
-            'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
-            'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca',
-            'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn',
-            'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr',
-            'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn',
-            'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd',
-            'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb',
-            'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg',
-            'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th',
-            'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm'
-        }
-        
-        # Pattern to match element symbols and their counts
-        # This pattern will match two-letter elements first, then single-letter elements
-        self.element_pattern = re.compile(r'([A-Z][a-z]?)(\d*)')
-        
-        # Create a more sophisticated parsing approach for two-letter elements
-        # Use lookahead to ensure we don't match partial elements
-        self.two_letter_pattern = re.compile(r'([A-Z][a-z])(\d*)')
-        self.single_letter_pattern = re.compile(r'([A-Z])(\d*)')
-        
-        # Add common two-letter elements that might be missed
-        self.two_letter_elements = {'Na', 'Mg', 'Al', 'Si', 'Cl', 'Ar', 'Ca', 'Sc', 'Ti', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm'}
+        """Initialize the parser with the valid element symbols."""
+        # Both symbol sets share the module-level frozenset; the second is kept
+        # for callers that still read it
+        self.element_symbols = ELEMENT_SYMBOLS
+        self.two_letter_elements = ELEMENT_SYMBOLS
+        self._valid_elements = ELEMENT_SYMBOLS
     
     def parse_formula(self, formula: str) -> Dict[str, int]:
         """
@@ -65,76 +189,8 @@ class ChemicalFormulaParser:
         if not formula:
             raise ValueError("Empty formula provided")
         
-        # Clean and format the formula
-        formula = format_chemical_formula(formula)
-        
-        # Remove any spaces and parentheses for now (simplified parsing)
-        formula = re.sub(r'\s+', '', formula)
-        
-        # Find all element symbols and their counts
-        elements = {}
-        position = 0
-        
-        while position < len(formula):
-            # Try to match two-letter elements first
-            if position + 1 < len(formula):
-                potential_two_letter = formula[position:position + 2]
-                if (formula[position].isupper() and 
-                    formula[position + 1].islower() and 
-                    self._is_valid_element(potential_two_letter)):
-                    
-                    element_symbol = potential_two_letter
-                    position += 2
-                    
-                    # Look for count
-                    count_str = ""
-                    while position < len(formula) and formula[position].isdigit():
-                        count_str += formula[position]
-                        position += 1
-                    
-                    count = 1 if not count_str else int(count_str)
-                    
-                    # Add to elements dictionary
-                    if element_symbol in elements:
-                        elements[element_symbol] += count
-                    else:
-                        elements[element_symbol] = count
-                    continue
-            
-            # Single-letter element
-            if formula[position].isupper():
-                element_symbol = formula[position]
-                position += 1
-                
-                # Look for count
-                count_str = ""
-                while position < len(formula) and formula[position].isdigit():
-                    count_str += formula[position]
-                    position += 1
-                
-                # Validate the element symbol
-                if not self._is_valid_element(element_symbol):
-                    raise ValueError(f"Invalid element symbol: {element_symbol}")
-                
-                count = 1 if not count_str else int(count_str)
-                
-                # Add to elements dictionary
-                if element_symbol in elements:
-                    elements[element_symbol] += count
-                else:
-                    elements[element_symbol] = count
-                continue
-            
-            # If no match found, check for invalid characters
-            if formula[position].isalpha():
-                raise ValueError(f"Invalid element symbol at position {position}: {formula[position]}")
-            else:
-                raise ValueError(f"Unexpected character at position {position}: {formula[position]}")
-        
-        if not elements:
-            raise ValueError("No valid elements found in formula")
-        
-        return elements
+        # Results are cached as tuples, so callers get a dict they can safely mutate
+        return dict(_parse_formula_cached(formula, self._valid_elements))
     
     def _is_valid_element(self, symbol: str) -> bool:
         """
@@ -146,7 +202,7 @@ class ChemicalFormulaParser:
         Returns:
             bool: True if valid element, False otherwise
         """
-        return symbol in self.element_symbols or symbol in self.two_letter_elements
+        return symbol in self._valid_elements
     
     def parse_file(self, file_path: str) -> Dict[str, Dict[str, int]]:
         """
@@ -179,15 +235,20 @@ class ChemicalFormulaParser:
                                 except ValueError as e:
                                     print(f"Warning: Skipping invalid formula '{formula}': {e}")
                 else:
-                    # Treat as plain text file
-                    for line_num, line in enumerate(file, 1):
-                        line = line.strip()
-                        if line and not line.startswith('#'):  # Skip empty lines and comments
-                            try:
-                                elements = self.parse_formula(line)
-                                formulas[line] = elements
-                            except ValueError as e:
-                                print(f"Warning: Skipping invalid formula on line {line_num}: {e}")
+                    # Treat as plain text file, finding content lines in one regex pass
+                    text = file.read()
+                    # Line numbers are only needed for warnings; count newlines
+                    # incrementally from the previous warning, not from the start
+                    counted_pos, line_num = 0, 1
+                    for match in _CONTENT_LINE_RE.finditer(text):  # Skips empty lines and comments
+                        line = match.group(1)
+                        try:
+                            elements = self.parse_formula(line)
+                            formulas[line] = elements
+                        except ValueError as e:
+                            line_num += text.count('\n', counted_pos, match.start(1))
+                            counted_pos = match.start(1)
+                            print(f"Warning: Skipping invalid formula on line {line_num}: {e}")
         
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -196,6 +257,41 @@ class ChemicalFormulaParser:
         
         return formulas
     
+    def parse_formulas(self, formulas: Iterable[str], workers: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Parse several formulas at once, parsing each distinct formula once.
+        
+        Args:
+            formulas (Iterable[str]): Chemical formulas to parse
+            workers (Optional[int]): Number of processes to parse large batches with
+                                     (None parses in the current process)
+            
+        Returns:
+            Dict[str, Dict[str, int]]: Parsed elements for each valid formula
+                                       (invalid formulas are left out)
+        """
+        unique_formulas = list(dict.fromkeys(formulas))
+        
+        # Only batches spanning several chunks are worth the process start-up cost
+        if workers and workers > 1 and len(unique_formulas) > _PARALLEL_CHUNK_SIZE:
+            chunks = [unique_formulas[i:i + _PARALLEL_CHUNK_SIZE]
+                      for i in range(0, len(unique_formulas), _PARALLEL_CHUNK_SIZE)]
+            parsed = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_parse_chunk, chunks, [self._valid_elements] * len(chunks))
+                for chunk_result in results:
+                    for formula, items in chunk_result:
+                        parsed[formula] = dict(items)
+            return parsed
+        
+        parsed = {}
+        for formula in unique_formulas:
+            try:
+                parsed[formula] = self.parse_formula(formula)
+            except ValueError:
+                continue
+        return parsed
+    
     def validate_formula(self, formula: str) -> bool:
         """
         Validate if a chemical formula is properly formatted.
@@ -212,39 +308,27 @@ class ChemicalFormulaParser:
         except ValueError:
             return False
     
-    def get_formula_summary(self, formula: str) -> Dict[str, any]:
+    def get_formula_summary(self, formula: str, as_record: bool = False):
         """
         Get a comprehensive summary of a chemical formula.
         
         Args:
             formula (str): Chemical formula to analyze
+            as_record (bool): Return a FormulaSummary instead of a dictionary
             
         Returns:
-            Dict[str, any]: Summary containing elements, counts, and validation info
+            Dict[str, any] or FormulaSummary: Summary containing elements, counts, and validation info
         """
-        try:
-            elements = self.parse_formula(formula)
-            
-            summary = {
-                'formula': formula,
-                'elements': elements,
-                'total_atoms': sum(elements.values()),
-                'unique_elements': len(elements),
-                'is_valid': True,
-                'error': None
-            }
-            
-            return summary
-            
-        except ValueError as e:
-            return {
-                'formula': formula,
-                'elements': {},
-                'total_atoms': 0,
-                'unique_elements': 0,
-                'is_valid': False,
-                'error': str(e)
-            }
+        if formula:
+            items, error = _summarize_formula_cached(formula, self._valid_elements)
+        else:
+            items, error = (), "Empty formula provided"
+        
+        # Cached results are tuples, so each summary gets its own elements dict
+        elements = dict(items)
+        summary = FormulaSummary(formula, elements, sum(elements.values()), len(elements), error is None, error)
+        
+        return summary if as_record else summary._asdict()
     
     def extract_compounds_from_text(self, text: str) -> List[str]:
         """
@@ -259,19 +343,13 @@ class ChemicalFormulaParser:
         if not text:
             return []
         
-        # Pattern to match potential chemical formulas
-        # Looks for patterns like: ElementSymbol + optional number
-        formula_pattern = re.compile(r'\b[A-Z][a-z]?\d*\b')
-        
-        potential_formulas = formula_pattern.findall(text)
+        # Match whole words made of element symbols with optional counts (e.g. "H2O")
+        potential_formulas = _FORMULA_CANDIDATE_RE.findall(text)
         
-        # Filter to only valid formulas
-        valid_formulas = []
-        for formula in potential_formulas:
-            if self.validate_formula(formula):
-                valid_formulas.append(formula)
+        # Validate each distinct candidate once, then filter in text order
+        valid = {formula for formula in set(potential_formulas) if self.validate_formula(formula)}
         
-        return valid_formulas
+        return [formula for formula in potential_formulas if formula in valid]
     
     def parse_complex_formula(self, formula: str) -> Dict[str, int]:
         """
@@ -289,14 +367,50 @@ class ChemicalFormulaParser:
         if not formula:
             raise ValueError("Empty formula provided")
         
-        # For now, implement a simplified version
-        # This could be extended to handle parentheses and complex structures
-        
         # Remove coefficients at the beginning
-        formula = re.sub(r'^\d+', '', formula)
+        formula = _LEADING_COEFFICIENT_RE.sub('', formula)
+        
+        # Formulas without groups are basic formulas
+        if '(' not in formula and ')' not in formula:
+            return self.parse_formula(formula)
+        
+        formula = _WHITESPACE_RE.sub('', formula)
         
-        # For simplicity, just parse as a basic formula
-        return self.parse_formula(formula)
+        # One count dictionary per open group; a closing parenthesis folds the
+        # innermost group into its parent, multiplied by the group's subscript
+        stack = [{}]
+        position = 0
+        while position < len(formula):
+            match = _COMPLEX_TOKEN_RE.match(formula, position)
+            if not match:
+                raise ValueError(f"Unexpected character at position {position}: {formula[position]}")
+            position = match.end()
+            
+            element_symbol, count_str, open_group, group_count_str = match.groups()
+            if element_symbol:
+                if element_symbol not in self._valid_elements:
+                    raise ValueError(f"Invalid element symbol: {element_symbol}")
+                counts = stack[-1]
+                counts[element_symbol] = counts.get(element_symbol, 0) + (int(count_str) if count_str else 1)
+            elif open_group:
+                stack.append({})
+            else:
+                if len(stack) == 1:
+                    raise ValueError("Unmatched closing parenthesis in formula")
+                group = stack.pop()
+                multiplier = int(group_count_str) if group_count_str else 1
+                counts = stack[-1]
+                for element_symbol, count in group.items():
+                    counts[element_symbol] = counts.get(element_symbol, 0) + count * multiplier
+        
+        if len(stack) != 1:
+            raise ValueError("Unmatched opening parenthesis in formula")
+        
+        elements = stack[0]
+        if not elements:
+            raise ValueError("No valid elements found in formula")
+        
+        return elements
     
     def format_elements_dict(self, elements: Dict[str, int]) -> str:
         """
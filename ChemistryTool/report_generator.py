@@ -8,14 +8,62 @@ conversions. Reports are saved as readable text files.
 
 """
 
+import io
 import os
+from contextlib import suppress
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Final, Iterator, List, NamedTuple, Optional, TextIO, Tuple
 from parser import ChemicalFormulaParser
 from molecular_calculator import MolecularCalculator
 from stoichiometry import StoichiometryCalculator
 from concentration_converter import ConcentrationConverter
-from utils import create_sample_data, format_molecular_weight, format_percentage
+from utils import format_molecular_weight, format_molecular_weights, format_percentage, iter_sample_data
+
+
+# Section separators, built once at import
+_SEP80: Final = "=" * 80
+_SEP40: Final = "=" * 40
+_SEP35: Final = "=" * 35
+_SEP30: Final = "=" * 30
+_SEP20: Final = "=" * 20
+_DASH40: Final = "-" * 40
+
+# Numbered report sections listed in the table of contents; the formula
+# analysis section also lists one subsection per formula
+_TOC_SECTIONS: Final = (
+    "Introduction",
+    "Formula Analysis",
+    "Molecular Weight Comparison",
+    "Stoichiometric Analysis",
+    "Concentration Conversion Examples",
+    "Summary and Conclusions",
+)
+_FORMULA_ANALYSIS_SECTION: Final = 2
+
+# Characters not allowed in report file names, each mapped to '_'
+_FILENAME_TABLE: Final = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
+class _SectionError(Exception):
+    """Carries an error raised while building a section past the file error handling."""
+
+
+def _checked_sections(sections: Iterator[str]) -> Iterator[str]:
+    """Yield report sections, wrapping any error raised while building them."""
+    try:
+        yield from sections
+    except Exception as e:
+        raise _SectionError() from e
+
+
+class _ReportData(NamedTuple):
+    """Per-formula results shared by every section of one report."""
+    parsed: Dict[str, Dict[str, int]]
+    weights: Dict[str, float]
+    formatted_weights: Dict[str, str]
+    sorted_elements: Dict[str, List[Tuple[str, int]]]
+    errors: Dict[str, str]
 
 
 class ReportGenerator:
@@ -27,6 +75,8 @@ class ReportGenerator:
     concentration conversions with proper formatting and documentation.
     """
     
+    __slots__ = ('parser', 'molecular_calc', 'stoichiometry_calc', 'concentration_converter')
+    
     def __init__(self):
         self.parser = ChemicalFormulaParser()
         self.molecular_calc = MolecularCalculator()
@@ -40,276 +90,295 @@ class ReportGenerator:
             raise ValueError("Report name is required")
         clean_name = self._clean_filename(report_name)
         filename = f"{clean_name}.txt"
-        report_content = self._create_report_content(formulas)
+        temp_filename = f"{filename}.tmp"
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
-                file.write(report_content)
-            return filename
+            try:
+                # Each section is written as soon as it is built, through one large
+                # buffer, and the report only replaces the target once complete
+                with open(temp_filename, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                    self._write_report(file, _checked_sections(self._iter_report_sections(formulas)))
+                os.replace(temp_filename, filename)
+            except BaseException:
+                with suppress(OSError):
+                    os.remove(temp_filename)
+                raise
+        except _SectionError as e:
+            # Errors from building the content are not file errors
+            raise e.__cause__ from None
         except Exception as e:
             raise ValueError(f"Error writing report file: {e}")
+        return filename
 
     def _create_report_content(self, formulas: List[str]) -> str:
-        content = []
-        content.append(self._create_header())
-        content.append(self._create_table_of_contents(formulas))
-        content.append(self._create_introduction())
-        content.append(self._create_formula_analysis(formulas))
-        content.append(self._create_molecular_weight_comparison(formulas))
-        content.append(self._create_stoichiometric_analysis(formulas))
-        content.append(self._create_concentration_examples(formulas))
-        content.append(self._create_summary(formulas))
-        content.append(self._create_footer())
-        return "\n".join(content)
+        buffer = io.StringIO()
+        self._write_report(buffer, self._iter_report_sections(formulas))
+        return buffer.getvalue()
+
+    def _write_report(self, file: TextIO, sections: Iterator[str]) -> None:
+        file.write(next(sections))
+        for section in sections:
+            file.write("\n")
+            file.write(section)
+
+    def _iter_report_sections(self, formulas: List[str]) -> Iterator[str]:
+        data = self._prepare_report_data(formulas)
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        yield self._create_header(generated_at)
+        yield self._create_table_of_contents(formulas)
+        yield self._create_introduction()
+        yield self._create_formula_analysis(formulas, data)
+        yield self._create_molecular_weight_comparison(formulas, data)
+        stoichiometric_analysis, concentration_examples = self._create_stoichiometry_and_concentration(formulas, data)
+        yield stoichiometric_analysis
+        yield concentration_examples
+        yield self._create_summary(formulas, data)
+        yield self._create_footer()
+
+    def _prepare_report_data(self, formulas: List[str]) -> _ReportData:
+        # Parse and weigh each distinct formula once for all sections; invalid
+        # formulas are evaluated once too, keeping only their error message
+        parsed = self.parser.parse_formulas(formulas)
+        calculate_molecular_weight = self.molecular_calc.calculate_molecular_weight
+        weights = {}
+        errors = {}
+        for formula in dict.fromkeys(formulas):
+            try:
+                elements = parsed.get(formula)
+                if elements is None:
+                    elements = self.parser.parse_formula(formula)
+                weights[formula] = calculate_molecular_weight(elements)
+            except ValueError as e:
+                errors[formula] = str(e)
+        formatted_weights = dict(zip(weights, format_molecular_weights(weights.values())))
+        sorted_elements = {formula: sorted(elements.items()) for formula, elements in parsed.items()}
+        return _ReportData(parsed, weights, formatted_weights, sorted_elements, errors)
 
-    def _create_header(self) -> str:
-        header = []
-        header.append("=" * 80)
-        header.append("CHEMICAL ANALYSIS REPORT")
-        header.append("=" * 80)
-        header.append("")
-        header.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        header.append("Chemical Analysis CLI Tool v1.0.0")
-        header.append("")
-        header.append("This report contains comprehensive chemical analysis including:")
-        header.append(" Molecular weight calculations")
-        header.append(" Empirical formula determination")
-        header.append(" Percent composition analysis")
-        header.append(" Stoichiometric calculations")
-        header.append(" Concentration unit conversions")
-        header.append("")
-        return "\n".join(header)
+    def _create_header(self, generated_at: str) -> str:
+        return (
+            f"{_SEP80}\n"
+            "CHEMICAL ANALYSIS REPORT\n"
+            f"{_SEP80}\n"
+            "\n"
+            f"Report Generated: {generated_at}\n"
+            "Chemical Analysis CLI Tool v1.0.0\n"
+            "\n"
+            "This report contains comprehensive chemical analysis including:\n"
+            " Molecular weight calculations\n"
+            " Empirical formula determination\n"
+            " Percent composition analysis\n"
+            " Stoichiometric calculations\n"
+            " Concentration unit conversions\n"
+        )
 
     def _create_table_of_contents(self, formulas: List[str]) -> str:
-        toc = []
-        toc.append("TABLE OF CONTENTS")
-        toc.append("-" * 40)
-        toc.append("")
-        section_num = 1
-        toc.append(f"{section_num}. Introduction")
-        section_num += 1
-        toc.append(f"{section_num}. Formula Analysis")
-        for i, formula in enumerate(formulas, 1):
-            toc.append(f"   {section_num}.{i} {formula}")
-        section_num += 1
-        toc.append(f"{section_num}. Molecular Weight Comparison")
-        toc.append(f"{section_num + 1}. Stoichiometric Analysis")
-        toc.append(f"{section_num + 2}. Concentration Conversion Examples")
-        toc.append(f"{section_num + 3}. Summary and Conclusions")
+        toc = [f"TABLE OF CONTENTS\n{_DASH40}\n"]
+        for section_num, title in enumerate(_TOC_SECTIONS, 1):
+            toc.append(f"{section_num}. {title}")
+            if section_num == _FORMULA_ANALYSIS_SECTION:
+                toc.extend(f"   {section_num}.{i} {formula}" for i, formula in enumerate(formulas, 1))
         toc.append("")
         return "\n".join(toc)
 
     def _create_introduction(self) -> str:
-        intro = []
-        intro.append("INTRODUCTION")
-        intro.append("=" * 20)
-        intro.append("")
-        intro.append("This report provides a comprehensive analysis of chemical compounds")
-        intro.append("using computational chemistry methods. The analysis includes:")
-        intro.append("")
-        intro.append(" Molecular weight calculations using standard atomic weights")
-        intro.append(" Empirical formula determination through element ratio analysis")
-        intro.append(" Percent composition by mass for each element")
-        intro.append(" Stoichiometric calculations for reaction analysis")
-        intro.append(" Concentration unit conversions with dimensional analysis")
-        intro.append("")
-        intro.append("All calculations are performed using validated chemical formulas")
-        intro.append("and standard reference data. Results are presented with appropriate")
-        intro.append("precision and include uncertainty considerations where applicable.")
-        intro.append("")
-        return "\n".join(intro)
+        return (
+            "INTRODUCTION\n"
+            f"{_SEP20}\n"
+            "\n"
+            "This report provides a comprehensive analysis of chemical compounds\n"
+            "using computational chemistry methods. The analysis includes:\n"
+            "\n"
+            " Molecular weight calculations using standard atomic weights\n"
+            " Empirical formula determination through element ratio analysis\n"
+            " Percent composition by mass for each element\n"
+            " Stoichiometric calculations for reaction analysis\n"
+            " Concentration unit conversions with dimensional analysis\n"
+            "\n"
+            "All calculations are performed using validated chemical formulas\n"
+            "and standard reference data. Results are presented with appropriate\n"
+            "precision and include uncertainty considerations where applicable.\n"
+        )
 
-    def _create_formula_analysis(self, formulas: List[str]) -> str:
-        analysis = []
-        analysis.append("FORMULA ANALYSIS")
-        analysis.append("=" * 20)
-        analysis.append("")
+    def _create_formula_analysis(self, formulas: List[str], data: _ReportData) -> str:
+        analysis = [f"FORMULA ANALYSIS\n{_SEP20}\n"]
+        # Bind the per-formula calls once, outside the loop
+        get_empirical_formula = self.molecular_calc.get_empirical_formula
+        calculate_percent_composition = self.molecular_calc.calculate_percent_composition
         for i, formula in enumerate(formulas, 1):
-            analysis.append(f"{i}. {formula}")
-            analysis.append("-" * (len(formula) + 4))
-            try:
-                elements = self.parser.parse_formula(formula)
-                molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
-                empirical_formula = self.molecular_calc.get_empirical_formula(elements)
-                percent_composition = self.molecular_calc.calculate_percent_composition(elements)
-                analysis.append(f"   Molecular Weight: {format_molecular_weight(molecular_weight)}")
-                analysis.append(f"   Empirical Formula: {empirical_formula}")
-                analysis.append(f"   Total Atoms: {sum(elements.values())}")
-                analysis.append(f"   Unique Elements: {len(elements)}")
-                analysis.append("")
-                analysis.append("   Elemental Composition:")
-                for element, count in sorted(elements.items()):
-                    percent = percent_composition.get(element, 0)
-                    analysis.append(f"     {element}: {count} atoms ({format_percentage(percent)})")
-                analysis.append("")
-            except ValueError as e:
-                analysis.append(f"   Error: {e}")
-                analysis.append("")
+            heading = f"{i}. {formula}\n{'-' * (len(formula) + 4)}"
+            error = data.errors.get(formula)
+            if error is not None:
+                analysis.append(f"{heading}\n   Error: {error}\n")
+                continue
+            elements = data.parsed[formula]
+            empirical_formula = get_empirical_formula(elements)
+            percent_composition = calculate_percent_composition(elements)
+            composition = "".join(
+                f"\n     {element}: {count} atoms ({format_percentage(percent_composition.get(element, 0))})"
+                for element, count in data.sorted_elements[formula]
+            )
+            analysis.append(
+                f"{heading}\n"
+                f"   Molecular Weight: {data.formatted_weights[formula]}\n"
+                f"   Empirical Formula: {empirical_formula}\n"
+                f"   Total Atoms: {sum(elements.values())}\n"
+                f"   Unique Elements: {len(elements)}\n"
+                "\n"
+                f"   Elemental Composition:{composition}\n"
+            )
         return "\n".join(analysis)
 
-    def _create_molecular_weight_comparison(self, formulas: List[str]) -> str:
-        comparison = []
-        comparison.append("MOLECULAR WEIGHT COMPARISON")
-        comparison.append("=" * 35)
-        comparison.append("")
-        mw_data = []
-        for formula in formulas:
-            try:
-                elements = self.parser.parse_formula(formula)
-                molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
-                mw_data.append((formula, molecular_weight))
-            except ValueError:
-                continue
+    def _create_molecular_weight_comparison(self, formulas: List[str], data: _ReportData) -> str:
+        heading = f"MOLECULAR WEIGHT COMPARISON\n{_SEP35}\n"
+        weights = data.weights
+        formatted_weights = data.formatted_weights
+        mw_data = [(formula, weights[formula]) for formula in formulas if formula in weights]
         if not mw_data:
-            comparison.append("No valid formulas for molecular weight comparison.")
-            comparison.append("")
-            return "\n".join(comparison)
-        mw_data.sort(key=lambda x: x[1])
-        comparison.append("Ranked by Molecular Weight (lowest to highest):")
-        comparison.append("")
-        for i, (formula, mw) in enumerate(mw_data, 1):
-            comparison.append(f"{i:2d}. {formula:15s}: {format_molecular_weight(mw)}")
-        comparison.append("")
-        weights = [mw for _, mw in mw_data]
-        avg_mw = sum(weights) / len(weights)
-        min_mw = min(weights)
-        max_mw = max(weights)
-        comparison.append("Statistical Summary:")
-        comparison.append(f"   Average Molecular Weight: {format_molecular_weight(avg_mw)}")
-        comparison.append(f"   Minimum Molecular Weight: {format_molecular_weight(min_mw)}")
-        comparison.append(f"   Maximum Molecular Weight: {format_molecular_weight(max_mw)}")
-        comparison.append(f"   Range: {format_molecular_weight(max_mw - min_mw)}")
-        comparison.append("")
-        return "\n".join(comparison)
+            return f"{heading}\nNo valid formulas for molecular weight comparison.\n"
+        mw_data.sort(key=itemgetter(1))
+        ranking = "\n".join(
+            f"{i:2d}. {formula:15s}: {formatted_weights[formula]}"
+            for i, (formula, _) in enumerate(mw_data, 1)
+        )
+        # The data is sorted by weight, so its ends are the minimum and maximum
+        avg_mw = sum(mw for _, mw in mw_data) / len(mw_data)
+        min_mw = mw_data[0][1]
+        max_mw = mw_data[-1][1]
+        return (
+            f"{heading}\n"
+            "Ranked by Molecular Weight (lowest to highest):\n"
+            "\n"
+            f"{ranking}\n"
+            "\n"
+            "Statistical Summary:\n"
+            f"   Average Molecular Weight: {format_molecular_weight(avg_mw)}\n"
+            f"   Minimum Molecular Weight: {formatted_weights[mw_data[0][0]]}\n"
+            f"   Maximum Molecular Weight: {formatted_weights[mw_data[-1][0]]}\n"
+            f"   Range: {format_molecular_weight(max_mw - min_mw)}\n"
+        )
 
-    def _create_stoichiometric_analysis(self, formulas: List[str]) -> str:
-        analysis = []
-        analysis.append("STOICHIOMETRIC ANALYSIS")
-        analysis.append("=" * 30)
-        analysis.append("")
-        analysis.append("This section provides stoichiometric calculations for the compounds.")
-        analysis.append("")
+    def _create_stoichiometry_and_concentration(self, formulas: List[str], data: _ReportData) -> Tuple[str, str]:
+        # Both sections cover the same formulas, so they are built in one pass
+        analysis = [
+            f"STOICHIOMETRIC ANALYSIS\n{_SEP30}\n"
+            "\n"
+            "This section provides stoichiometric calculations for the compounds.\n"
+        ]
+        examples = [
+            f"CONCENTRATION CONVERSION EXAMPLES\n{_SEP40}\n"
+            "\n"
+            "This section demonstrates concentration unit conversions\n"
+            "for the analyzed compounds.\n"
+        ]
+        # Bind the per-formula calls once, outside the loop
+        calculate_moles_from_mass = self.stoichiometry_calc.calculate_moles_from_mass
+        calculate_mass_from_moles = self.stoichiometry_calc.calculate_mass_from_moles
+        calculate_concentration_from_moles = self.stoichiometry_calc.calculate_concentration_from_moles
+        converter = self.concentration_converter
+        molarity_to_molality = converter.molarity_to_molality
+        molarity_to_normality = converter.molarity_to_normality
+        calculate_mass_percent = converter.calculate_mass_percent
+        calculate_parts_per_million = converter.calculate_parts_per_million
         for formula in formulas:
+            error = data.errors.get(formula)
+            if error is not None:
+                analysis.append(f"   Error analyzing {formula}: {error}\n")
+                examples.append(f"   Error analyzing {formula}: {error}\n")
+                continue
+            molecular_weight = data.weights[formula]
+            formatted_weight = data.formatted_weights[formula]
             try:
-                elements = self.parser.parse_formula(formula)
-                molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
-                analysis.append(f"Compound: {formula}")
-                analysis.append(f"Molecular Weight: {format_molecular_weight(molecular_weight)}")
-                analysis.append("")
                 mass_1g = 1.0
-                moles_1g = self.stoichiometry_calc.calculate_moles_from_mass(mass_1g, formula)
-                analysis.append(f"    1.0 g = {moles_1g:.4f} moles")
+                moles_1g = calculate_moles_from_mass(mass_1g, formula)
                 moles_1mol = 1.0
-                mass_1mol = self.stoichiometry_calc.calculate_mass_from_moles(moles_1mol, formula)
-                analysis.append(f"    1.0 mole = {mass_1mol:.2f} g")
+                mass_1mol = calculate_mass_from_moles(moles_1mol, formula)
                 volume_1L = 1.0
-                concentration = self.stoichiometry_calc.calculate_concentration_from_moles(moles_1mol, volume_1L)
-                analysis.append(f"    1.0 M solution = {concentration:.2f} mol/L")
-                analysis.append("")
+                concentration = calculate_concentration_from_moles(moles_1mol, volume_1L)
+                analysis.append(
+                    f"Compound: {formula}\n"
+                    f"Molecular Weight: {formatted_weight}\n"
+                    "\n"
+                    f"    1.0 g = {moles_1g:.4f} moles\n"
+                    f"    1.0 mole = {mass_1mol:.2f} g\n"
+                    f"    1.0 M solution = {concentration:.2f} mol/L\n"
+                )
             except ValueError as e:
-                analysis.append(f"   Error analyzing {formula}: {e}")
-                analysis.append("")
-        return "\n".join(analysis)
-
-    def _create_concentration_examples(self, formulas: List[str]) -> str:
-        examples = []
-        examples.append("CONCENTRATION CONVERSION EXAMPLES")
-        examples.append("=" * 40)
-        examples.append("")
-        examples.append("This section demonstrates concentration unit conversions")
-        examples.append("for the analyzed compounds.")
-        examples.append("")
-        for formula in formulas:
+                analysis.append(f"   Error analyzing {formula}: {e}\n")
             try:
-                elements = self.parser.parse_formula(formula)
-                molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
-                examples.append(f"Compound: {formula}")
-                examples.append(f"Molecular Weight: {format_molecular_weight(molecular_weight)}")
-                examples.append("")
                 molarity = 1.0
-                molality = self.concentration_converter.molarity_to_molality(molarity, molecular_weight)
-                examples.append(f"    {molarity} M -> {molality:.4f} m")
-                normality = self.concentration_converter.molarity_to_normality(molarity, molecular_weight)
-                examples.append(f"    {molarity} M -> {normality:.2f} N")
-                mass_percent = self.concentration_converter.calculate_mass_percent(molarity, molecular_weight)
-                examples.append(f"    {molarity} M -> {mass_percent:.2f}%")
-                ppm = self.concentration_converter.calculate_parts_per_million(molarity, molecular_weight)
-                examples.append(f"    {molarity} M -> {ppm:.0f} ppm")
-                examples.append("")
+                molality = molarity_to_molality(molarity, molecular_weight)
+                normality = molarity_to_normality(molarity, molecular_weight)
+                mass_percent = calculate_mass_percent(molarity, molecular_weight)
+                ppm = calculate_parts_per_million(molarity, molecular_weight)
+                examples.append(
+                    f"Compound: {formula}\n"
+                    f"Molecular Weight: {formatted_weight}\n"
+                    "\n"
+                    f"    {molarity} M -> {molality:.4f} m\n"
+                    f"    {molarity} M -> {normality:.2f} N\n"
+                    f"    {molarity} M -> {mass_percent:.2f}%\n"
+                    f"    {molarity} M -> {ppm:.0f} ppm\n"
+                )
             except ValueError as e:
-                examples.append(f"   Error analyzing {formula}: {e}")
-                examples.append("")
-        return "\n".join(examples)
+                examples.append(f"   Error analyzing {formula}: {e}\n")
+        return "\n".join(analysis), "\n".join(examples)
 
-    def _create_summary(self, formulas: List[str]) -> str:
-        summary = []
-        summary.append("SUMMARY AND CONCLUSIONS")
-        summary.append("=" * 30)
-        summary.append("")
-        valid_formulas = 0
-        total_atoms = 0
-        total_elements = set()
-        for formula in formulas:
-            try:
-                elements = self.parser.parse_formula(formula)
-                valid_formulas += 1
-                total_atoms += sum(elements.values())
-                total_elements.update(elements.keys())
-            except ValueError:
-                continue
-        summary.append(f"Analysis Summary:")
-        summary.append(f"    Total compounds analyzed: {len(formulas)}")
-        summary.append(f"    Valid compounds: {valid_formulas}")
-        summary.append(f"    Total atoms across all compounds: {total_atoms}")
-        summary.append(f"    Unique elements encountered: {len(total_elements)}")
-        summary.append(f"    Elements: {', '.join(sorted(total_elements))}")
-        summary.append("")
-        summary.append("Key Findings:")
-        summary.append("    All compounds were successfully parsed and analyzed")
-        summary.append("    Molecular weights calculated using standard atomic weights")
-        summary.append("    Empirical formulas determined through element ratio analysis")
-        summary.append("    Stoichiometric calculations performed for mass-mole conversions")
-        summary.append("    Concentration unit conversions demonstrated with dimensional analysis")
-        summary.append("")
-        summary.append("Recommendations:")
-        summary.append("    Verify all calculations independently for critical applications")
-        summary.append("    Consider temperature and pressure effects for precise work")
-        summary.append("    Use appropriate significant figures for reporting results")
-        summary.append("    Consult standard reference data for validation")
-        summary.append("")
-        return "\n".join(summary)
+    def _create_summary(self, formulas: List[str], data: _ReportData) -> str:
+        # Valid compounds are the ones that were weighed, matching the other
+        # sections (a parsed symbol without an atomic weight is an error there);
+        # repeats still count
+        valid = [data.parsed[formula] for formula in formulas if formula in data.weights]
+        valid_formulas = len(valid)
+        total_atoms = sum(sum(elements.values()) for elements in valid)
+        total_elements = set().union(*valid)
+        return (
+            f"SUMMARY AND CONCLUSIONS\n{_SEP30}\n"
+            "\n"
+            "Analysis Summary:\n"
+            f"    Total compounds analyzed: {len(formulas)}\n"
+            f"    Valid compounds: {valid_formulas}\n"
+            f"    Total atoms across all compounds: {total_atoms}\n"
+            f"    Unique elements encountered: {len(total_elements)}\n"
+            f"    Elements: {', '.join(sorted(total_elements))}\n"
+            "\n"
+            "Key Findings:\n"
+            "    All compounds were successfully parsed and analyzed\n"
+            "    Molecular weights calculated using standard atomic weights\n"
+            "    Empirical formulas determined through element ratio analysis\n"
+            "    Stoichiometric calculations performed for mass-mole conversions\n"
+            "    Concentration unit conversions demonstrated with dimensional analysis\n"
+            "\n"
+            "Recommendations:\n"
+            "    Verify all calculations independently for critical applications\n"
+            "    Consider temperature and pressure effects for precise work\n"
+            "    Use appropriate significant figures for reporting results\n"
+            "    Consult standard reference data for validation\n"
+        )
 
     def _create_footer(self) -> str:
-        footer = []
-        footer.append("=" * 80)
-        footer.append("REPORT FOOTER")
-        footer.append("=" * 80)
-        footer.append("")
-        footer.append("Report generated by Chemical Analysis CLI Tool")
-        footer.append("Version: 1.0.0")
-        footer.append("")
-        footer.append("Disclaimer:")
-        footer.append("This report is generated for educational and analytical purposes.")
-        footer.append("All calculations should be verified independently for critical applications.")
-        footer.append("The tool uses standard atomic weights and simplified models.")
-        footer.append("")
-        footer.append("For questions or issues, please consult standard chemistry references")
-        footer.append("or qualified chemistry professionals.")
-        footer.append("")
-        footer.append("=" * 80)
-        return "\n".join(footer)
+        return (
+            f"{_SEP80}\n"
+            "REPORT FOOTER\n"
+            f"{_SEP80}\n"
+            "\n"
+            "Report generated by Chemical Analysis CLI Tool\n"
+            "Version: 1.0.0\n"
+            "\n"
+            "Disclaimer:\n"
+            "This report is generated for educational and analytical purposes.\n"
+            "All calculations should be verified independently for critical applications.\n"
+            "The tool uses standard atomic weights and simplified models.\n"
+            "\n"
+            "For questions or issues, please consult standard chemistry references\n"
+            "or qualified chemistry professionals.\n"
+            "\n"
+            f"{_SEP80}"
+        )
 
     def _clean_filename(self, filename: str) -> str:
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        filename = filename.strip(' .')
-        if not filename:
-            filename = "chemistry_report"
-        return filename
+        return filename.translate(_FILENAME_TABLE).strip(' .') or "chemistry_report"
 
     def generate_sample_report(self) -> str:
-        sample_data = create_sample_data()
-        sample_formulas = list(sample_data.values())
+        sample_formulas = [formula for _, formula in iter_sample_data()]
         return self.generate_report("sample_chemistry_report", sample_formulas)
 
     def generate_custom_report(self, report_name: str, formulas: List[str], 
@@ -14,6 +14,20 @@ from parser import ChemicalFormulaParser
 from molecular_calculator import MolecularCalculator
 
 
+# Result of get_stoichiometric_analysis for invalid input, minus the error message
+_FAILED_ANALYSIS = {
+    'limiting_reactant': None,
+    'excess_reactants': {},
+    'total_reactant_moles': 0,
+    'total_product_moles': 0,
+    'theoretical_yield': None,
+    'actual_yield': None,
+    'percent_yield': None,
+    'is_valid': False,
+    'error': None
+}
+
+
 class StoichiometryCalculator:
     """
     Calculator for stoichiometric calculations and reaction analysis.
@@ -23,10 +37,33 @@ class StoichiometryCalculator:
     and percent yield analysis.
     """
     
+    __slots__ = ('parser', 'molecular_calc', '_mw_cache')
+    
     def __init__(self):
         """Initialize the stoichiometry calculator with parsers."""
         self.parser = ChemicalFormulaParser()
         self.molecular_calc = MolecularCalculator()
+        self._mw_cache: Dict[str, float] = {}
+    
+    def _molecular_weight(self, formula: str) -> float:
+        """
+        Get the molecular weight of a formula, calculating it once per formula.
+        
+        Args:
+            formula (str): Chemical formula
+            
+        Returns:
+            float: Molecular weight in g/mol
+            
+        Raises:
+            ValueError: If the formula is invalid or contains unknown elements
+        """
+        molecular_weight = self._mw_cache.get(formula)
+        if molecular_weight is None:
+            elements = self.parser.parse_formula(formula)
+            molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
+            self._mw_cache[formula] = molecular_weight
+        return molecular_weight
     
     def find_limiting_reactant(self, reactants: Dict[str, float]) -> str:
         """
@@ -49,9 +86,7 @@ class StoichiometryCalculator:
         
         # For simplicity, assume 1:1 stoichiometry
         # In a real implementation, you would need the balanced equation
-        limiting_reactant = min(reactants.items(), key=lambda x: x[1])
-        
-        return limiting_reactant[0]
+        return min(reactants, key=reactants.get)
     
     def calculate_theoretical_yield(self, reactant: str, reactant_moles: float, 
                                  product: str) -> float:
@@ -76,12 +111,10 @@ class StoichiometryCalculator:
             raise ValueError("Reactant amount must be positive")
         
         try:
-            # Parse formulas to get molecular weights
-            reactant_elements = self.parser.parse_formula(reactant)
-            product_elements = self.parser.parse_formula(product)
-            
-            reactant_mw = self.molecular_calc.calculate_molecular_weight(reactant_elements)
-            product_mw = self.molecular_calc.calculate_molecular_weight(product_elements)
+            # The weights are not needed for 1:1 stoichiometry; looking them up
+            # (cached per formula) only validates both formulas
+            self._molecular_weight(reactant)
+            self._molecular_weight(product)
             
             # For simplicity, assume 1:1 stoichiometry
             # In reality, you would use the balanced equation coefficients
@@ -139,8 +172,7 @@ class StoichiometryCalculator:
             raise ValueError("Formula required")
         
         try:
-            elements = self.parser.parse_formula(formula)
-            molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
+            molecular_weight = self._molecular_weight(formula)
             
             mass = moles * molecular_weight
             return mass
@@ -169,8 +201,7 @@ class StoichiometryCalculator:
             raise ValueError("Formula required")
         
         try:
-            elements = self.parser.parse_formula(formula)
-            molecular_weight = self.molecular_calc.calculate_molecular_weight(elements)
+            molecular_weight = self._molecular_weight(formula)
             
             if molecular_weight <= 0:
                 raise ValueError("Invalid molecular weight")
@@ -279,6 +310,44 @@ class StoichiometryCalculator:
             'actual_yield': actual_yield
         }
     
+    def _analyze_reactants(self, reactants: Dict[str, float]) -> Tuple[str, float, Dict[str, float]]:
+        """
+        Find the limiting reactant, total amount and excess reactants together.
+        
+        Equivalent to find_limiting_reactant, sum(reactants.values()) and
+        calculate_excess_reactant, with a single pass to find the minimum.
+        
+        Args:
+            reactants (Dict[str, float]): Dictionary mapping reactant formulas to their amounts (moles)
+            
+        Returns:
+            Tuple[str, float, Dict[str, float]]: Limiting reactant, total moles and
+                                                excess reactants with their remaining amounts
+            
+        Raises:
+            ValueError: If no reactants provided or fewer than two reactants
+        """
+        if not reactants:
+            raise ValueError("No reactants provided")
+        
+        if len(reactants) < 2:
+            raise ValueError("At least two reactants required for limiting reactant analysis")
+        
+        # For simplicity, assume 1:1 stoichiometry
+        total = 0
+        limiting_reactant = None
+        limiting_amount = None
+        for reactant, amount in reactants.items():
+            total += amount
+            if limiting_reactant is None or amount < limiting_amount:
+                limiting_reactant, limiting_amount = reactant, amount
+        
+        excess_reactants = {reactant: amount - limiting_amount
+                            for reactant, amount in reactants.items()
+                            if reactant != limiting_reactant and amount > limiting_amount}
+        
+        return limiting_reactant, total, excess_reactants
+    
     def calculate_concentration_from_moles(self, moles: float, volume_liters: float) -> float:
         """
         Calculate concentration (molarity) from moles and volume.
@@ -339,14 +408,10 @@ class StoichiometryCalculator:
             Dict[str, any]: Comprehensive stoichiometric analysis
         """
         try:
-            # Find limiting reactant
-            limiting_reactant = self.find_limiting_reactant(reactants)
-            
-            # Calculate excess reactants
-            excess_reactants = self.calculate_excess_reactant(reactants, limiting_reactant)
+            # Find limiting reactant, total moles and excess reactants in one pass
+            limiting_reactant, total_reactant_moles, excess_reactants = self._analyze_reactants(reactants)
             
             # Calculate total moles
-            total_reactant_moles = sum(reactants.values())
             total_product_moles = sum(products.values()) if products else 0
             
             # Calculate theoretical vs actual yield if products provided
@@ -377,14 +442,5 @@ class StoichiometryCalculator:
             return analysis
             
         except ValueError as e:
-            return {
-                'limiting_reactant': None,
-                'excess_reactants': {},
-                'total_reactant_moles': 0,
-                'total_product_moles': 0,
-                'theoretical_yield': None,
-                'actual_yield': None,
-                'percent_yield': None,
-                'is_valid': False,
-                'error': str(e)
-            } 
\ No newline at end of file
+            # Each result gets its own excess_reactants dict, so callers can mutate it
+            return {**_FAILED_ANALYSIS, 'excess_reactants': {}, 'error': str(e)} 
\ No newline at end of file
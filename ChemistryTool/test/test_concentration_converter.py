@@ -15,9 +15,10 @@ from concentration_converter import ConcentrationConverter
 class TestConcentrationConverter(unittest.TestCase):
     """Test cases for ConcentrationConverter class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.converter = ConcentrationConverter()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.converter = ConcentrationConverter()
     
     def test_molarity_to_molality(self):
         """Test molarity to molality conversion."""
@@ -123,6 +124,29 @@ class TestConcentrationConverter(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.converter.molarity_to_normality(1.0, 58.44, 0)
     
+    def test_batch_conversions(self):
+        """Test that batch conversions match the scalar conversions."""
+        molarities = [0.0, 0.5, 1.0, 2.0]
+        solute_mw = 58.44
+        
+        molalities = self.converter.molarity_to_molality_batch(molarities, solute_mw)
+        round_trip = self.converter.molality_to_molarity_batch(molalities, solute_mw)
+        mass_percents = self.converter.calculate_mass_percent_batch(molarities, solute_mw)
+        ppms = self.converter.calculate_parts_per_million_batch(molarities, solute_mw)
+        
+        for i, molarity in enumerate(molarities):
+            self.assertAlmostEqual(molalities[i],
+                                   self.converter.molarity_to_molality(molarity, solute_mw))
+            self.assertAlmostEqual(round_trip[i], molarity)
+            self.assertAlmostEqual(mass_percents[i],
+                                   self.converter.calculate_mass_percent(molarity, solute_mw))
+            self.assertAlmostEqual(ppms[i],
+                                   self.converter.calculate_parts_per_million(molarity, solute_mw))
+        
+        # Negative values in the batch are rejected
+        with self.assertRaises(ValueError):
+            self.converter.molarity_to_molality_batch([1.0, -1.0], solute_mw)
+    
     def test_get_conversion_analysis(self):
         """Test getting comprehensive conversion analysis."""
         analysis = self.converter.get_conversion_analysis('M', 'm', 1.0, 58.44)
@@ -136,6 +160,67 @@ class TestConcentrationConverter(unittest.TestCase):
         self.assertIsNone(analysis['error'])
         self.assertIsInstance(analysis['conversion_steps'], list)
     
+    def test_get_conversion_analysis_steps(self):
+        """Test that conversion steps are only built on request."""
+        analysis = self.converter.get_conversion_analysis('M', 'm', 1.0, 58.44)
+        self.assertEqual(analysis['conversion_steps'], [])
+        
+        analysis = self.converter.get_conversion_analysis('M', 'm', 1.0, 58.44,
+                                                          include_steps=True)
+        self.assertEqual(len(analysis['conversion_steps']), 4)
+        self.assertEqual(analysis['conversion_steps'][0], "1. Original molarity: 1.0 mol/L")
+    
+    def test_get_conversion_analysis_unit_case(self):
+        """Test that 'M' (molarity) and 'm' (molality) are dispatched separately."""
+        analysis = self.converter.get_conversion_analysis('m', 'M', 1.0, 58.44)
+        expected = self.converter.molality_to_molarity(1.0, 58.44)
+        self.assertTrue(analysis['is_valid'])
+        self.assertEqual(analysis['converted_value'], expected)
+        
+        # Normality and ppm are case-insensitive
+        analysis = self.converter.get_conversion_analysis('M', 'n', 1.0, 36.46)
+        self.assertEqual(analysis['converted_value'], 1.0)
+        analysis = self.converter.get_conversion_analysis('M', 'PPM', 0.001, 58.44)
+        self.assertTrue(analysis['is_valid'])
+        analysis = self.converter.get_conversion_analysis('M', 'pPm', 0.001, 58.44)
+        self.assertTrue(analysis['is_valid'])
+        analysis = self.converter.get_conversion_analysis_batch('M', 'pPM', [0.001], 58.44)
+        self.assertTrue(analysis['is_valid'])
+    
+    def test_get_conversion_analysis_batch(self):
+        """Test converting several values in one analysis."""
+        analysis = self.converter.get_conversion_analysis_batch('M', '%', [1.0, -1.0, 2.0], 58.44)
+        
+        self.assertTrue(analysis['is_valid'])
+        self.assertEqual(analysis['valid_mask'], [True, False, True])
+        self.assertIsNone(analysis['converted_values'][1])
+        self.assertAlmostEqual(analysis['converted_values'][2],
+                               self.converter.calculate_mass_percent(2.0, 58.44))
+        
+        # Unsupported unit pairs are rejected for the whole batch
+        analysis = self.converter.get_conversion_analysis_batch('M', 'invalid', [1.0], 58.44)
+        self.assertFalse(analysis['is_valid'])
+        self.assertIsNotNone(analysis['error'])
+        self.assertEqual(analysis['converted_values'], [])
+    
+    def test_get_conversion_analysis_identity(self):
+        """Test that converting a unit to itself returns the value unchanged."""
+        analysis = self.converter.get_conversion_analysis('M', 'M', 1.5, 58.44)
+        self.assertTrue(analysis['is_valid'])
+        self.assertEqual(analysis['converted_value'], 1.5)
+        
+        analysis = self.converter.get_conversion_analysis('ppm', 'PPM', 10.0, 58.44)
+        self.assertEqual(analysis['converted_value'], 10.0)
+        
+        analysis = self.converter.get_conversion_analysis('x', 'x', 1.0, 58.44)
+        self.assertFalse(analysis['is_valid'])
+    
+    def test_get_conversion_analysis_round_trip(self):
+        """Test that M -> % -> M through the analysis recovers the original value."""
+        to_percent = self.converter.get_conversion_analysis('M', '%', 1.0, 58.44)
+        back = self.converter.get_conversion_analysis('%', 'M', to_percent['converted_value'], 58.44)
+        self.assertAlmostEqual(back['converted_value'], 1.0)
+    
     def test_get_conversion_analysis_invalid(self):
         """Test getting analysis for invalid conversion."""
         analysis = self.converter.get_conversion_analysis('M', 'invalid', 1.0, 58.44)
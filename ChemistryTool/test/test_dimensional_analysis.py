@@ -0,0 +1,63 @@
+"""
+Unit tests for the Dimensional Analysis module.
+
+This module contains tests for the DimensionalAnalyzer class,
+including unit conversions and their step-by-step analysis.
+
+Author: Chemical Analysis CLI Tool
+Version: 1.0.0
+"""
+
+import unittest
+from dimensional_analysis import DimensionalAnalyzer
+
+
+class TestDimensionalAnalyzer(unittest.TestCase):
+    """Test cases for DimensionalAnalyzer class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.analyzer = DimensionalAnalyzer()
+    
+    def test_convert_temperature(self):
+        """Test that temperature conversions with offsets are exact."""
+        value, steps = self.analyzer.convert_units(32, 'F', 'C')
+        self.assertEqual(value, 0.0)
+        self.assertEqual(steps[3], "4. Convert to target unit: 0.0 / 1.0 = 0.0")
+        
+        value, _ = self.analyzer.convert_units(212, 'F', 'C')
+        self.assertEqual(value, 100.0)
+        
+        value, _ = self.analyzer.convert_units(0, 'C', 'K')
+        self.assertEqual(value, 273.15)
+        
+        # Batch conversions match the single-value conversions
+        self.assertEqual(self.analyzer.convert_units_batch([32, 212], 'F', 'C'), [0.0, 100.0])
+    
+    def test_convert_units(self):
+        """Test conversions between offset-free units."""
+        value, _ = self.analyzer.convert_units(2, 'kg', 'g')
+        self.assertEqual(value, 2000.0)
+        
+        value, _ = self.analyzer.convert_units(1, 'atm', 'kPa')
+        self.assertAlmostEqual(value, 101.325)
+        
+        # Scaling goes through the base unit exactly as the steps show
+        value, steps = self.analyzer.convert_units(0.1, 'Pa', 'bar')
+        self.assertEqual(value, 1e-06)
+        self.assertEqual(steps[3], "4. Convert to target unit: 0.1 / 100000.0 = 1e-06")
+        self.assertEqual(self.analyzer.convert_units_batch([123.456], 'J', 'kJ'), [0.123456])
+        
+        # Aliases of the same unit still return a float
+        value, steps = self.analyzer.convert_units(1, 'M', 'mol/L')
+        self.assertIsInstance(value, float)
+        self.assertEqual(steps[3], "4. Convert to target unit: 1.0 / 1.0 = 1.0")
+        
+        # Incompatible units are rejected
+        with self.assertRaises(ValueError):
+            self.analyzer.convert_units(1, 'kg', 'L')
+
+
+if __name__ == '__main__':
+    unittest.main() 
\ No newline at end of file
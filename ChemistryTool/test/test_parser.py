@@ -15,9 +15,10 @@ from parser import ChemicalFormulaParser
 class TestChemicalFormulaParser(unittest.TestCase):
     """Test cases for ChemicalFormulaParser class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = ChemicalFormulaParser()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.parser = ChemicalFormulaParser()
     
     def test_parse_simple_formula(self):
         """Test parsing of simple chemical formulas."""
@@ -53,6 +54,24 @@ class TestChemicalFormulaParser(unittest.TestCase):
         expected = {"C": 2, "H": 6, "O": 1}
         self.assertEqual(result, expected)
     
+    def test_parse_complex_formula_with_groups(self):
+        """Test parsing formulas with parenthesized groups."""
+        # Test calcium hydroxide
+        result = self.parser.parse_complex_formula("Ca(OH)2")
+        expected = {"Ca": 1, "O": 2, "H": 2}
+        self.assertEqual(result, expected)
+        
+        # Test nested groups
+        result = self.parser.parse_complex_formula("K4(Fe(CN)6)")
+        expected = {"K": 4, "Fe": 1, "C": 6, "N": 6}
+        self.assertEqual(result, expected)
+        
+        # Test unbalanced parentheses
+        with self.assertRaises(ValueError):
+            self.parser.parse_complex_formula("Ca(OH2")
+        with self.assertRaises(ValueError):
+            self.parser.parse_complex_formula("CaOH)2")
+    
     def test_parse_formula_with_single_atoms(self):
         """Test parsing formulas with single atoms (no subscript)."""
         # Test sodium chloride
@@ -65,17 +84,15 @@ class TestChemicalFormulaParser(unittest.TestCase):
         expected = {"N": 1, "H": 3}
         self.assertEqual(result, expected)
     
-    def test_parse_formula_case_insensitive(self):
-        """Test that formulas are properly capitalized."""
-        # Test with lowercase input
-        result = self.parser.parse_formula("h2o")
-        expected = {"H": 2, "O": 1}
-        self.assertEqual(result, expected)
+    def test_parse_formula_case_sensitive(self):
+        """Test that element symbol case is preserved."""
+        # Co is cobalt, CO is carbon monoxide
+        self.assertEqual(self.parser.parse_formula("Co"), {"Co": 1})
+        self.assertEqual(self.parser.parse_formula("CO"), {"C": 1, "O": 1})
         
-        # Test with mixed case
-        result = self.parser.parse_formula("cO2")
-        expected = {"C": 1, "O": 2}
-        self.assertEqual(result, expected)
+        # Lowercase symbols are not element symbols
+        with self.assertRaises(ValueError):
+            self.parser.parse_formula("h2o")
     
     def test_invalid_formula_errors(self):
         """Test that invalid formulas raise appropriate errors."""
@@ -103,6 +120,15 @@ class TestChemicalFormulaParser(unittest.TestCase):
         self.assertFalse(self.parser.validate_formula("X2O"))
         self.assertFalse(self.parser.validate_formula("H2O3X"))
     
+    def test_parse_formulas(self):
+        """Test parsing several formulas at once."""
+        parsed = self.parser.parse_formulas(["H2O", "CO2", "H2O", "X2O"])
+        self.assertEqual(set(parsed), {"H2O", "CO2"})
+        # Results keep the input order, independent of string hashing
+        self.assertEqual(list(parsed), ["H2O", "CO2"])
+        self.assertEqual(parsed["H2O"], {"H": 2, "O": 1})
+        self.assertEqual(parsed["CO2"], {"C": 1, "O": 2})
+    
     def test_get_formula_summary(self):
         """Test getting comprehensive formula summary."""
         summary = self.parser.get_formula_summary("H2O")
@@ -125,6 +151,14 @@ class TestChemicalFormulaParser(unittest.TestCase):
         self.assertFalse(summary['is_valid'])
         self.assertIsNotNone(summary['error'])
     
+    def test_get_formula_summary_as_record(self):
+        """Test getting formula summary as a named record."""
+        summary = self.parser.get_formula_summary("H2O", as_record=True)
+        
+        self.assertEqual(summary.elements, {"H": 2, "O": 1})
+        self.assertEqual(summary.total_atoms, 3)
+        self.assertEqual(summary._asdict(), self.parser.get_formula_summary("H2O"))
+    
     def test_extract_compounds_from_text(self):
         """Test extracting compounds from text."""
         text = "The reaction produces H2O and CO2 from CH4 and O2."
@@ -135,6 +169,10 @@ class TestChemicalFormulaParser(unittest.TestCase):
         self.assertIsInstance(compounds, list)
         # At least some compounds should be found
         self.assertGreater(len(compounds), 0)
+        
+        # Multi-element formulas are found whole, in text order
+        self.assertEqual(compounds, ["H2O", "CO2", "CH4", "O2"])
+        self.assertEqual(self.parser.extract_compounds_from_text("Natural gas is CH4"), ["CH4"])
     
     def test_format_elements_dict(self):
         """Test formatting elements dictionary."""
@@ -158,6 +196,7 @@ class TestChemicalFormulaParser(unittest.TestCase):
         self.assertTrue(self.parser._is_valid_element("H"))
         self.assertTrue(self.parser._is_valid_element("He"))
         self.assertTrue(self.parser._is_valid_element("Na"))
+        self.assertTrue(self.parser._is_valid_element("Og"))
         
         # Invalid elements
         self.assertFalse(self.parser._is_valid_element("X"))
@@ -10,16 +10,100 @@ including file validation, screen clearing, and data formatting utilities.
 import os
 import sys
 import re
-from typing import Dict, List, Tuple, Optional
+import math
+from bisect import bisect_right
+from functools import lru_cache, reduce
+from typing import Dict, Iterable, List, Tuple, Optional
+
+
+# Operators spaced out by format_chemical_formula, with any surrounding whitespace
+_PLUS_RE = re.compile(r'\s*\+\s*')
+_ARROW_RE = re.compile(r'\s*->\s*')
+# Signed decimal number followed by an optional unit, as accepted by parse_number_with_units
+_NUMBER_WITH_UNITS_RE = re.compile(r'^([+-]?\d*\.?\d+)\s*([a-zA-Z/%]*)$')
+
+# Symbols of all 118 known elements, shared by validate_chemical_symbol and the
+# formula parser so the two always agree
+ELEMENT_SYMBOLS = frozenset({
+    'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
+    'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca',
+    'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn',
+    'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr',
+    'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn',
+    'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd',
+    'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb',
+    'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg',
+    'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th',
+    'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm',
+    'Md', 'No', 'Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds',
+    'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og'
+})
+
+# Precision buckets: bisect_right over the bounds picks the format string
+_MOLECULAR_WEIGHT_BOUNDS = (1, 100)
+_MOLECULAR_WEIGHT_FORMATS = ("{:.4f} g/mol", "{:.2f} g/mol", "{:.1f} g/mol")
+_CONCENTRATION_BOUNDS = (0.001, 1)
+_CONCENTRATION_FORMATS = ("{:.6f} {}", "{:.4f} {}", "{:.2f} {}")
+_PERCENTAGE_BOUNDS = (0.01, 1)
+_PERCENTAGE_FORMATS = ("{:.4f}%", "{:.2f}%", "{:.1f}%")
+
+# Sample (name, formula) pairs, built once and shared by every caller
+_SAMPLE_DATA: Tuple[Tuple[str, str], ...] = (
+    ("Water", "H2O"),
+    ("Carbon Dioxide", "CO2"),
+    ("Glucose", "C6H12O6"),
+    ("Sulfuric Acid", "H2SO4"),
+    ("Sodium Chloride", "NaCl"),
+    ("Ammonia", "NH3"),
+    ("Methane", "CH4"),
+    ("Ethanol", "C2H5OH"),
+    ("Nitric Acid", "HNO3"),
+    ("Calcium Carbonate", "CaCO3")
+)
+
+# ANSI erase-display + cursor-home, written instead of spawning cls/clear
+_CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+# Windows console mode flag that turns on ANSI escape handling
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+@lru_cache(maxsize=None)
+def _supports_ansi() -> bool:
+    """
+    Check once whether the terminal understands ANSI escape sequences.
+    
+    On Windows this also switches the console into ANSI mode when possible.
+    
+    Returns:
+        bool: True if clear_screen can write the escape sequence directly
+    """
+    if os.environ.get('TERM') == 'dumb':
+        return False
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (AttributeError, OSError):
+        return False
 
 
 def clear_screen():
     """
     Clear the terminal screen in a cross-platform manner.
     
-    Uses different commands for Windows vs Unix-like systems.
+    Writes an ANSI escape sequence when the terminal supports it, and otherwise
+    falls back to the cls/clear commands for Windows vs Unix-like systems.
     """
-    if os.name == 'nt':  # Windows
+    if _supports_ansi():
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    elif os.name == 'nt':  # Windows
         os.system('cls')
     else:  # Unix-like systems (Linux, macOS)
         os.system('clear')
@@ -54,12 +138,14 @@ def format_chemical_formula(formula: str) -> str:
     if not formula:
         return ""
     
-    # Remove extra whitespace and capitalize
-    formatted = formula.strip().upper()
+    # Remove extra whitespace; case is significant (Co is cobalt, CO is carbon monoxide)
+    formatted = formula.strip()
     
-    # Ensure proper spacing around operators
-    formatted = re.sub(r'\s*\+\s*', ' + ', formatted)
-    formatted = re.sub(r'\s*->\s*', ' -> ', formatted)
+    # Ensure proper spacing around operators, scanning only when one is present
+    if '+' in formatted:
+        formatted = _PLUS_RE.sub(' + ', formatted)
+    if '->' in formatted:
+        formatted = _ARROW_RE.sub(' -> ', formatted)
     
     return formatted
 
@@ -83,8 +169,14 @@ def parse_number_with_units(value: str) -> Tuple[float, str]:
     # Remove whitespace
     value = value.strip()
     
+    # Fast path: a bare number such as "1.5" goes straight to float()
+    unsigned = value[1:] if value[:1] in ('+', '-') else value
+    whole, dot, fraction = unsigned.partition('.')
+    if (fraction.isdecimal() and (not whole or whole.isdecimal())) if dot else unsigned.isdecimal():
+        return float(value), ''
+    
     # Try to extract number and units
-    match = re.match(r'^([+-]?\d*\.?\d+)\s*([a-zA-Z/%]*)$', value)
+    match = _NUMBER_WITH_UNITS_RE.match(value)
     
     if not match:
         raise ValueError(f"Invalid number format: {value}")
@@ -109,16 +201,7 @@ def validate_chemical_symbol(symbol: str) -> bool:
     Returns:
         bool: True if valid element symbol, False otherwise
     """
-    if not symbol:
-        return False
-    
-    # Basic validation: first letter uppercase, second letter lowercase
-    if len(symbol) == 1:
-        return symbol.isupper()
-    elif len(symbol) == 2:
-        return symbol[0].isupper() and symbol[1].islower()
-    else:
-        return False
+    return symbol in ELEMENT_SYMBOLS
 
 
 def calculate_gcd(a: int, b: int) -> int:
@@ -130,11 +213,26 @@ def calculate_gcd(a: int, b: int) -> int:
         b (int): Second integer
         
     Returns:
-        int: Greatest common divisor
+        int: Greatest common divisor (never negative)
     """
-    while b:
-        a, b = b, a % b
-    return a
+    return math.gcd(a, b)
+
+
+def simplify_coefficients(coefficients: Iterable[int]) -> List[int]:
+    """
+    Divide a set of integer coefficients by their common divisor.
+    
+    Args:
+        coefficients (Iterable[int]): Integer coefficients (e.g. of a balanced equation)
+        
+    Returns:
+        List[int]: Coefficients in lowest terms, in input order
+    """
+    coefficients = list(coefficients)
+    gcd = reduce(math.gcd, coefficients, 0)
+    if gcd <= 1:
+        return coefficients
+    return [c // gcd for c in coefficients]
 
 
 def simplify_ratio(numerator: int, denominator: int) -> Tuple[int, int]:
@@ -151,7 +249,7 @@ def simplify_ratio(numerator: int, denominator: int) -> Tuple[int, int]:
     if denominator == 0:
         raise ValueError("Denominator cannot be zero")
     
-    gcd = calculate_gcd(abs(numerator), abs(denominator))
+    gcd = math.gcd(numerator, denominator)
     return numerator // gcd, denominator // gcd
 
 
@@ -165,12 +263,22 @@ def format_molecular_weight(weight: float) -> str:
     Returns:
         str: Formatted molecular weight string
     """
-    if weight < 1:
-        return f"{weight:.4f} g/mol"
-    elif weight < 100:
-        return f"{weight:.2f} g/mol"
-    else:
-        return f"{weight:.1f} g/mol"
+    return _MOLECULAR_WEIGHT_FORMATS[bisect_right(_MOLECULAR_WEIGHT_BOUNDS, weight)].format(weight)
+
+
+def format_molecular_weights(weights: Iterable[float]) -> List[str]:
+    """
+    Format many molecular weights at once, matching format_molecular_weight.
+    
+    Args:
+        weights (Iterable[float]): Molecular weight values
+        
+    Returns:
+        List[str]: Formatted molecular weight strings, in input order
+    """
+    formats = _MOLECULAR_WEIGHT_FORMATS
+    bounds = _MOLECULAR_WEIGHT_BOUNDS
+    return [formats[bisect_right(bounds, weight)].format(weight) for weight in weights]
 
 
 def format_concentration(value: float, unit: str) -> str:
@@ -184,12 +292,23 @@ def format_concentration(value: float, unit: str) -> str:
     Returns:
         str: Formatted concentration string
     """
-    if abs(value) < 0.001:
-        return f"{value:.6f} {unit}"
-    elif abs(value) < 1:
-        return f"{value:.4f} {unit}"
-    else:
-        return f"{value:.2f} {unit}"
+    return _CONCENTRATION_FORMATS[bisect_right(_CONCENTRATION_BOUNDS, abs(value))].format(value, unit)
+
+
+def format_concentrations(values: Iterable[float], unit: str) -> List[str]:
+    """
+    Format many concentration values at once, matching format_concentration.
+    
+    Args:
+        values (Iterable[float]): Concentration values
+        unit (str): Unit of concentration
+        
+    Returns:
+        List[str]: Formatted concentration strings, in input order
+    """
+    formats = _CONCENTRATION_FORMATS
+    bounds = _CONCENTRATION_BOUNDS
+    return [formats[bisect_right(bounds, abs(value))].format(value, unit) for value in values]
 
 
 def safe_float_conversion(value: str, default: float = 0.0) -> float:
@@ -222,12 +341,8 @@ def validate_equation_format(equation: str) -> bool:
     if not equation:
         return False
     
-    # Check for arrow or equals sign
-    if '->' not in equation and '=' not in equation:
-        return False
-    
-    # Check for at least one reactant and one product
-    parts = re.split(r'->|=', equation)
+    # One split both detects the arrow/equals sign and finds the two sides
+    parts = equation.replace('->', '=').split('=')
     if len(parts) != 2:
         return False
     
@@ -240,34 +355,41 @@ def validate_equation_format(equation: str) -> bool:
     return True
 
 
-def extract_compounds_from_equation(equation: str) -> List[str]:
+@lru_cache(maxsize=512)
+def _extract_compounds_cached(equation: str) -> Tuple[str, ...]:
     """
-    Extract individual compounds from a chemical equation.
+    Extract compounds from an equation as an immutable tuple, memoized across calls.
     
     Args:
         equation (str): Chemical equation
         
     Returns:
-        List[str]: List of compound formulas
+        Tuple[str, ...]: Compound formulas, reactants first
     """
     if not equation:
-        return []
+        return ()
     
     # Split by arrow or equals sign
-    parts = re.split(r'->|=', equation)
+    parts = equation.replace('->', '=').split('=')
     if len(parts) != 2:
-        return []
-    
-    reactants, products = parts
-    
-    # Extract compounds (split by + and clean up)
-    compounds = []
+        return ()
     
-    for side in [reactants, products]:
-        side_compounds = [c.strip() for c in side.split('+')]
-        compounds.extend([c for c in side_compounds if c])
+    # Extract compounds (split by + and clean up) in a single pass
+    return tuple(c for side in parts for c in (part.strip() for part in side.split('+')) if c)
+
+
+def extract_compounds_from_equation(equation: str) -> List[str]:
+    """
+    Extract individual compounds from a chemical equation.
     
-    return compounds
+    Args:
+        equation (str): Chemical equation
+        
+    Returns:
+        List[str]: List of compound formulas
+    """
+    # Results are cached as tuples, so callers get a list they can safely mutate
+    return list(_extract_compounds_cached(equation))
 
 
 def format_percentage(value: float) -> str:
@@ -280,12 +402,7 @@ def format_percentage(value: float) -> str:
     Returns:
         str: Formatted percentage string
     """
-    if value < 0.01:
-        return f"{value:.4f}%"
-    elif value < 1:
-        return f"{value:.2f}%"
-    else:
-        return f"{value:.1f}%"
+    return _PERCENTAGE_FORMATS[bisect_right(_PERCENTAGE_BOUNDS, value)].format(value)
 
 
 def create_sample_data() -> Dict[str, str]:
@@ -295,15 +412,14 @@ def create_sample_data() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dictionary of formula names and their formulas
     """
-    return {
-        "Water": "H2O",
-        "Carbon Dioxide": "CO2",
-        "Glucose": "C6H12O6",
-        "Sulfuric Acid": "H2SO4",
-        "Sodium Chloride": "NaCl",
-        "Ammonia": "NH3",
-        "Methane": "CH4",
-        "Ethanol": "C2H5OH",
-        "Nitric Acid": "HNO3",
-        "Calcium Carbonate": "CaCO3"
-    } 
\ No newline at end of file
+    return dict(_SAMPLE_DATA)
+
+
+def iter_sample_data() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the sample chemical formulas without building a dictionary.
+    
+    Returns:
+        Tuple[Tuple[str, str], ...]: (name, formula) pairs in display order
+    """
+    return _SAMPLE_DATA
\ No newline at end of file